@@ -0,0 +1,295 @@
+"""
+Archive of mapped timetables from many terms.
+
+Terms are registered by name and path, and only a small global index is
+kept on disk and in memory: which terms each unit code sat in. A term's
+entries are loaded on the first query that needs them, and at most
+`max_resident` terms (or `memory_budget` bytes) stay loaded, evicting the
+least recently used first. Unit history queries use the index to load
+only the terms the unit appears in.
+"""
+import argparse
+import json
+import os
+import sys
+from collections import OrderedDict, defaultdict
+from typing import Iterable, List, Dict, Optional, Any
+import logging
+
+from time_slots import normalize_unit_code
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ARCHIVE = "archive.json"
+INDEX_VERSION = 1
+
+
+def _estimate_size(entries: List[Dict[str, Any]]) -> int:
+    """Approximate bytes held by a list of entries, counting shared strings once."""
+    size = sys.getsizeof(entries)
+    strings = {}
+    for item in entries:
+        size += sys.getsizeof(item)
+        for value in item.values():
+            strings[id(value)] = value
+    return size + sum(sys.getsizeof(value) for value in strings.values())
+
+
+class TermData:
+    """A loaded term: its entries grouped by normalized unit code."""
+
+    def __init__(self, entries: Iterable[Dict[str, Any]]):
+        self.entries = list(entries)
+        self.units: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        for item in self.entries:
+            self.units[normalize_unit_code(item["unit_code"])].append(item)
+        self.size = _estimate_size(self.entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def by_unit(self, unit_code: str) -> List[Dict[str, Any]]:
+        """Entries for a unit code in this term."""
+        return self.units.get(normalize_unit_code(unit_code), [])
+
+    def close(self) -> None:
+        """Nothing to release; entries are dropped with the object."""
+
+
+class ArchiveStore:
+    """
+    Registry of terms with lazy loading, LRU eviction and a unit history index.
+
+    Args:
+        index_path: JSON file holding the term registry and unit index;
+            it is read if it exists and rewritten on every registration
+        max_resident: Maximum number of terms kept loaded
+        memory_budget: Optional bound, in bytes, on the estimated size of
+            loaded terms. The most recently used term always stays loaded.
+    """
+
+    def __init__(self, index_path: Optional[str] = None, max_resident: int = 4,
+                 memory_budget: Optional[int] = None):
+        if max_resident < 1:
+            raise ValueError("max_resident must be at least 1")
+
+        self.index_path = index_path
+        self.max_resident = max_resident
+        self.memory_budget = memory_budget
+        self.terms: Dict[str, Dict[str, Any]] = {}
+        self.unit_terms: Dict[str, List[str]] = {}
+        self._resident: "OrderedDict[str, Any]" = OrderedDict()
+        self._resident_bytes = 0
+
+        if index_path and os.path.exists(index_path):
+            self._read_index()
+
+    def _read_index(self) -> None:
+        """Load the term registry and unit index from disk."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except Exception as e:
+            raise ValueError(f"Failed to read archive index. Error: {e}")
+        if index.get("version") != INDEX_VERSION:
+            raise ValueError(f"Unsupported archive index version in {self.index_path}")
+        self.terms = index["terms"]
+        self.unit_terms = index["units"]
+        logger.info(f"Archive index: {len(self.terms)} terms, {len(self.unit_terms)} unit codes")
+
+    def _write_index(self) -> None:
+        """Persist the term registry and unit index, if the store has a path."""
+        if not self.index_path:
+            return
+        try:
+            with open(self.index_path, "w", encoding="utf-8") as f:
+                json.dump({"version": INDEX_VERSION, "terms": self.terms, "units": self.unit_terms},
+                          f, ensure_ascii=False)
+        except Exception as e:
+            raise ValueError(f"Failed to write archive index. Error: {e}")
+
+    def register(self, term: str, path: str) -> int:
+        """
+        Register a term's mapped timetable and index its unit codes.
+
+        The file is read once to build the index and then released; it is
+        loaded again only when queried. Registering an existing term replaces it.
+
+        Args:
+            term: Term name, e.g. "2024-T1"
+            path: Workbook, JSON export, Parquet/Feather export or snapshot
+
+        Returns:
+            Number of unit codes indexed for the term
+        """
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"Timetable file not found: {path}")
+
+        if term in self.terms:
+            self.unregister(term, save=False)
+
+        data = self._load_path(path)
+        try:
+            if hasattr(data, "unit_codes"):
+                # Snapshots list their unit codes from the index alone
+                unit_codes = {normalize_unit_code(code) for code in data.unit_codes()}
+            else:
+                unit_codes = set(data.units)
+            n_entries = len(data)
+        finally:
+            data.close()
+
+        self.terms[term] = {"path": os.path.abspath(path), "entries": n_entries, "units": len(unit_codes)}
+        for code in unit_codes:
+            self.unit_terms.setdefault(code, []).append(term)
+        self._write_index()
+        logger.info(f"Registered term {term}: {n_entries} entries, {len(unit_codes)} unit codes")
+        return len(unit_codes)
+
+    def unregister(self, term: str, save: bool = True) -> None:
+        """Remove a term from the registry and the unit index."""
+        if term not in self.terms:
+            raise KeyError(f"Unknown term: {term}")
+        self._evict(term)
+        del self.terms[term]
+        for code in list(self.unit_terms):
+            terms = [t for t in self.unit_terms[code] if t != term]
+            if terms:
+                self.unit_terms[code] = terms
+            else:
+                del self.unit_terms[code]
+        if save:
+            self._write_index()
+
+    @staticmethod
+    def _load_path(path: str) -> Any:
+        """Open a snapshot in place, or read any other format into a TermData."""
+        if path.lower().endswith(".wsnap"):
+            from snapshot import Snapshot
+            return Snapshot(path)
+
+        from timetable_diff import iter_entries
+        return TermData(iter_entries(path))
+
+    @staticmethod
+    def _size_of(data: Any) -> int:
+        """Resident cost of a loaded term; a snapshot costs at most its mapped file."""
+        if hasattr(data, "size"):
+            return data.size
+        return os.path.getsize(data.path)
+
+    def _evict(self, term: str) -> None:
+        """
+        Drop the store's reference to a loaded term.
+
+        Evicted data is not closed: callers may still hold what get()
+        returned, and a snapshot's map is released once the last reference
+        to it is gone.
+        """
+        data = self._resident.pop(term, None)
+        if data is not None:
+            self._resident_bytes -= self._size_of(data)
+            logger.debug(f"Evicted term {term}")
+
+    def get(self, term: str) -> Any:
+        """
+        A term's loaded data, loading it on first use.
+
+        Returns:
+            Object with len() and by_unit(unit_code): a Snapshot for .wsnap
+            terms, otherwise a TermData. It stays usable after the term is
+            evicted; eviction only stops the store from keeping it loaded.
+        """
+        if term in self._resident:
+            self._resident.move_to_end(term)
+            return self._resident[term]
+        if term not in self.terms:
+            raise KeyError(f"Unknown term: {term}")
+
+        path = self.terms[term]["path"]
+        try:
+            data = self._load_path(path)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to load term {term} from {path}. Error: {e}")
+
+        self._resident[term] = data
+        self._resident_bytes += self._size_of(data)
+        logger.info(f"Loaded term {term} ({len(data)} entries)")
+
+        # Evict least recently used terms, always keeping the one just loaded
+        while len(self._resident) > 1 and (
+            len(self._resident) > self.max_resident
+            or (self.memory_budget is not None and self._resident_bytes > self.memory_budget)
+        ):
+            self._evict(next(iter(self._resident)))
+        return data
+
+    def resident_terms(self) -> List[str]:
+        """Loaded terms, least recently used first."""
+        return list(self._resident)
+
+    def terms_for_unit(self, unit_code: str) -> List[str]:
+        """Terms a unit code sat in, from the index alone."""
+        return list(self.unit_terms.get(normalize_unit_code(unit_code), []))
+
+    def unit_history(self, unit_code: str) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Every sitting of a unit across the archive.
+
+        Only terms the index lists for the unit are loaded.
+
+        Returns:
+            Term name to that term's entries for the unit, in registration order
+        """
+        return {term: self.get(term).by_unit(unit_code) for term in self.terms_for_unit(unit_code)}
+
+    def close(self) -> None:
+        """Drop every loaded term; data returned by get() stays usable."""
+        for term in list(self._resident):
+            self._evict(term)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Register terms and look up unit histories from the command line."""
+    parser = argparse.ArgumentParser(description="Archive of mapped timetables across terms.")
+    parser.add_argument("-a", "--archive", default=DEFAULT_ARCHIVE,
+                        help=f"Archive index file (default: {DEFAULT_ARCHIVE})")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    register = commands.add_parser("register", help="Add or replace a term")
+    register.add_argument("term", help="Term name, e.g. 2024-T1")
+    register.add_argument("path", help="Workbook or mapped export of the term")
+
+    commands.add_parser("terms", help="List registered terms")
+
+    history = commands.add_parser("history", help="Show every sitting of a unit")
+    history.add_argument("unit_code")
+    args = parser.parse_args(argv)
+
+    try:
+        store = ArchiveStore(args.archive)
+        if args.command == "register":
+            n_units = store.register(args.term, args.path)
+            print(f"✓ Registered {args.term}: {n_units} unit codes")
+        elif args.command == "terms":
+            for term, info in store.terms.items():
+                print(f"{term}: {info['entries']} entries, {info['units']} units ({info['path']})")
+        else:
+            found = store.unit_history(args.unit_code)
+            if not found:
+                print(f"❌ {args.unit_code} not found in any registered term")
+                return 1
+            for term, entries in found.items():
+                for item in entries:
+                    print(f"{term}: {item['day']} {item['date']} {item['time']} Room {item['room']}")
+        store.close()
+    except (FileNotFoundError, ValueError, KeyError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+"""
+Headless batch mapping of timetable workbooks.
+
+Maps many workbooks in a process pool and writes one output per workbook or a
+single merged output. This module never imports tkinter, so it is safe to run
+from cron on machines without a display.
+
+Exit codes:
+    0  every workbook was mapped and written
+    1  some workbooks failed
+    2  usage error or no workbooks found
+    3  every workbook failed
+"""
+import argparse
+import glob
+import logging
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Tuple, Optional, Any
+
+from excel_mapper import ExcelMapper
+
+logger = logging.getLogger(__name__)
+
+EXIT_OK = 0
+EXIT_PARTIAL_FAILURE = 1
+EXIT_USAGE = 2
+EXIT_ALL_FAILED = 3
+
+# Both readers (openpyxl and the SAX reader) handle OOXML workbooks only
+WORKBOOK_EXTENSIONS = (".xlsx", ".xlsm")
+# Output format to file extension
+OUTPUT_FORMATS = {"json": ".json", "parquet": ".parquet", "feather": ".feather", "snapshot": ".wsnap"}
+
+
+def collect_workbooks(inputs: List[str]) -> List[str]:
+    """Expand files, directories and glob patterns into a sorted list of workbooks."""
+    workbooks = []
+    for item in inputs:
+        if os.path.isdir(item):
+            candidates = [os.path.join(item, name) for name in os.listdir(item)]
+        elif os.path.exists(item):
+            candidates = [item]
+        else:
+            candidates = glob.glob(item)
+
+        for path in candidates:
+            name = os.path.basename(path)
+            # Skip office lock files such as ".~lock.exam2.xlsx#" and "~$exam.xlsx"
+            if name.startswith(("~$", ".~lock")):
+                continue
+            if os.path.isfile(path) and path.lower().endswith(WORKBOOK_EXTENSIONS):
+                workbooks.append(path)
+
+    return sorted(set(workbooks))
+
+
+def plan_outputs(workbooks: List[str], output_dir: str, extension: str) -> Dict[str, str]:
+    """
+    Choose one output path per workbook without collisions.
+
+    Outputs are named after the workbook's file name. Workbooks sharing a
+    name (a/exam.xlsx and b/exam.xlsx) keep their path relative to the
+    inputs' common directory instead, and the workbook extension is kept
+    when that alone still collides (exam.xlsx and exam.xlsm).
+
+    Raises:
+        ValueError: If two workbooks would still write the same file
+    """
+    def stem(path: str) -> str:
+        return os.path.splitext(os.path.basename(path))[0]
+
+    counts: Dict[str, int] = {}
+    for path in workbooks:
+        counts[stem(path)] = counts.get(stem(path), 0) + 1
+
+    root = os.path.commonpath([os.path.dirname(os.path.abspath(path)) for path in workbooks])
+    names = {}
+    for path in workbooks:
+        if counts[stem(path)] == 1:
+            names[path] = stem(path)
+        else:
+            names[path] = os.path.splitext(os.path.relpath(os.path.abspath(path), root))[0]
+
+    relative_counts: Dict[str, int] = {}
+    for name in names.values():
+        relative_counts[name] = relative_counts.get(name, 0) + 1
+    outputs = {}
+    for path, name in names.items():
+        if relative_counts[name] > 1:
+            name = os.path.relpath(os.path.abspath(path), root) if counts[stem(path)] > 1 else os.path.basename(path)
+        outputs[path] = os.path.join(output_dir, name + extension)
+
+    seen: Dict[str, str] = {}
+    for path, output in outputs.items():
+        key = os.path.normcase(os.path.abspath(output))
+        if key in seen:
+            raise ValueError(f"{seen[key]} and {path} would both be written to {output}")
+        seen[key] = path
+    return outputs
+
+
+def merge_format(merge_path: str, file_format: Optional[str]) -> str:
+    """
+    Output format of a merged file, taken from its extension.
+
+    Merged entries carry a "source" key naming their workbook, which
+    snapshots cannot store, so a merge must be JSON, Parquet or Feather.
+
+    Raises:
+        ValueError: If the extension is unknown, disagrees with an explicit
+            format, or names a snapshot
+    """
+    extension = os.path.splitext(merge_path)[1].lower()
+    by_extension = {ext: name for name, ext in OUTPUT_FORMATS.items()}
+    if extension not in by_extension:
+        raise ValueError(f"Cannot tell the format of {merge_path}; use a .json, .parquet or .feather file")
+    if file_format is not None and file_format != by_extension[extension]:
+        raise ValueError(f"--format {file_format} does not match the {extension} extension of {merge_path}")
+    if by_extension[extension] == "snapshot":
+        raise ValueError("Snapshots cannot record each entry's source workbook; "
+                         "merge to .json, .parquet or .feather, or write one snapshot per workbook")
+    return by_extension[extension]
+
+
+def map_workbook(filepath: str, sheet_name: int = 0, chapel_label: str = "CHAPEL",
+                 low_memory: bool = False,
+                 engine: Optional[str] = None) -> Tuple[str, Optional[List[Dict[str, Any]]], float, Optional[str]]:
+    """
+    Load and map one workbook, capturing failures instead of raising.
+
+    Returns:
+        Tuple of (filepath, entries or None, elapsed seconds, error message or None)
+    """
+    start = time.perf_counter()
+    try:
+        mapper = ExcelMapper(filepath, low_memory=low_memory)
+        mapper.load_excel(sheet_name=sheet_name, engine=engine)
+        entries = mapper.map_headings(chapel_label=chapel_label)
+        return filepath, entries, time.perf_counter() - start, None
+    except Exception as e:
+        return filepath, None, time.perf_counter() - start, str(e)
+
+
+def write_output(entries: List[Dict[str, Any]], output_path: str, file_format: str) -> None:
+    """Write mapped entries in the chosen output format."""
+    if file_format == "json":
+        ExcelMapper("").export_to_json(entries, output_path)
+    elif file_format == "snapshot":
+        ExcelMapper("").export_to_snapshot(entries, output_path)
+    else:
+        ExcelMapper("").export_to_columnar(entries, output_path, file_format=file_format)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command-line argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="batch_cli",
+        description="Map timetable workbooks without starting the GUI.",
+    )
+    parser.add_argument("inputs", nargs="+",
+                        help="Workbook files, directories or glob patterns")
+    parser.add_argument("-w", "--workers", type=int, default=os.cpu_count() or 1,
+                        help="Number of worker processes (default: CPU count)")
+    parser.add_argument("-f", "--format", choices=list(OUTPUT_FORMATS),
+                        help="Output format (default: json, or the --merge file's extension)")
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("-o", "--output-dir", default=".",
+                        help="Directory for one output per workbook (default: current directory)")
+    target.add_argument("-m", "--merge",
+                        help="Write all entries to this single file instead, each with a "
+                             "'source' key naming its workbook")
+    parser.add_argument("--sheet", type=int, default=0, help="Sheet index to map (default: 0)")
+    parser.add_argument("--chapel-label", default="CHAPEL",
+                        help="Label of chapel entries to skip (default: CHAPEL)")
+    parser.add_argument("--engine", choices=("openpyxl", "sax"),
+                        help="Workbook reader (default: openpyxl, or sax with --low-memory)")
+    parser.add_argument("--low-memory", action="store_true",
+                        help="Stream sheets into categorical columns and release them once mapped; "
+                             "lowers peak memory on large workbooks (sax engine only)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Show mapper log output")
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the batch mapper and return a process exit code."""
+    parser = build_parser()
+    try:
+        args = parser.parse_args(argv)
+    except SystemExit as e:
+        return EXIT_USAGE if e.code else EXIT_OK
+
+    logging.getLogger().setLevel(logging.INFO if args.verbose else logging.WARNING)
+
+    if args.workers < 1:
+        print("❌ Error: --workers must be at least 1")
+        return EXIT_USAGE
+    if args.low_memory and args.engine == "openpyxl":
+        print("❌ Error: --low-memory reads with the sax engine and cannot be combined with --engine openpyxl")
+        return EXIT_USAGE
+
+    workbooks = collect_workbooks(args.inputs)
+    if not workbooks:
+        print("❌ Error: no workbooks found in the given inputs")
+        return EXIT_USAGE
+
+    try:
+        if args.merge:
+            file_format = merge_format(args.merge, args.format)
+        else:
+            file_format = args.format or "json"
+            outputs = plan_outputs(workbooks, args.output_dir, OUTPUT_FORMATS[file_format])
+    except ValueError as e:
+        print(f"❌ Error: {e}")
+        return EXIT_USAGE
+    if not args.merge:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    start = time.perf_counter()
+    n = len(workbooks)
+    if args.workers == 1 or n == 1:
+        results = [
+            map_workbook(path, args.sheet, args.chapel_label, args.low_memory, args.engine)
+            for path in workbooks
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=min(args.workers, n)) as executor:
+            results = list(executor.map(
+                map_workbook, workbooks, [args.sheet] * n, [args.chapel_label] * n,
+                [args.low_memory] * n, [args.engine] * n,
+            ))
+
+    failures = 0
+    merged = []
+    for filepath, entries, elapsed, error in results:
+        if error is None and not args.merge:
+            output_path = outputs[filepath]
+            try:
+                os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+                write_output(entries, output_path, file_format)
+            except Exception as e:
+                error = str(e)
+
+        if error is not None:
+            failures += 1
+            print(f"❌ {filepath}: {error} ({elapsed:.2f} s)")
+        else:
+            if args.merge:
+                merged.extend(dict(item, source=filepath) for item in entries)
+            print(f"✓ {filepath}: {len(entries)} entries in {elapsed:.2f} s")
+
+    if args.merge and failures < n:
+        try:
+            write_output(merged, args.merge, file_format)
+            print(f"✓ Merged {len(merged)} entries into {args.merge}")
+        except Exception as e:
+            print(f"❌ Failed to write {args.merge}: {e}")
+            return EXIT_ALL_FAILED
+
+    print(f"Processed {n - failures}/{n} workbooks in {time.perf_counter() - start:.2f} s")
+    if failures == n:
+        return EXIT_ALL_FAILED
+    return EXIT_PARTIAL_FAILURE if failures else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,56 @@
+"""Unit history lookups over a many-term archive, cold and with hot terms resident."""
+import json
+import os
+import random
+import tempfile
+import time
+
+from synthetic import generate_entries
+from archive_store import ArchiveStore
+
+
+def main():
+    rng = random.Random(3)
+    n_terms = 24
+    with tempfile.TemporaryDirectory() as tmp:
+        index_path = os.path.join(tmp, "archive.json")
+        store = ArchiveStore(index_path)
+        start = time.perf_counter()
+        for t in range(n_terms):
+            # Each term offers a different slice of a shared catalogue, so a
+            # unit sits in a few terms rather than all of them
+            entries = generate_entries(4000, n_rooms=300, seed=t)
+            path = os.path.join(tmp, f"term{t:02d}.json")
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump([e for e in entries if rng.random() < 0.15], f)
+            store.register(f"T{t:02d}", path)
+        print(f"Registered {n_terms} terms in {time.perf_counter() - start:.2f} s, "
+              f"index {os.path.getsize(index_path) / 1e3:.0f} kB")
+
+        units = list(store.unit_terms)
+        start = time.perf_counter()
+        for term in store.terms:
+            store.get(term)
+        print(f"Loading every term, as a lookup without the index would: "
+              f"{(time.perf_counter() - start) * 1000:.1f} ms")
+        store.close()
+
+        for max_resident in (2, 8, 24):
+            store = ArchiveStore(index_path, max_resident=max_resident)
+            start = time.perf_counter()
+            store.terms_for_unit(units[0])
+            index_only = time.perf_counter() - start
+
+            queries = [rng.choice(units) for _ in range(200)]
+            start = time.perf_counter()
+            for unit in queries:
+                store.unit_history(unit)
+            elapsed = time.perf_counter() - start
+            print(f"max_resident {max_resident:2d}: index-only {index_only * 1e6:6.1f} us, "
+                  f"history {elapsed / len(queries) * 1000:7.2f} ms/query, "
+                  f"{len(store.resident_terms())} resident, {store._resident_bytes / 1e6:.1f} MB")
+            store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""Compare JSON with Parquet/Feather exports on load time and file size."""
+import json
+import os
+import tempfile
+import time
+
+from synthetic import generate_entries
+from columnar_store import write_entries, load_entries
+
+
+def timed(func, repeat=5):
+    """Return the best wall time of `repeat` calls and the last result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_units in (2000, 20000, 100000):
+            entries = generate_entries(n_units, n_rooms=400, n_weeks=6)
+            unit = entries[len(entries) // 2]["unit_code"]
+            date = entries[0]["date"]
+
+            json_path = os.path.join(tmp, "output.json")
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=4, ensure_ascii=False)
+
+            def load_json():
+                with open(json_path, encoding="utf-8") as f:
+                    return json.load(f)
+
+            def load_json_filtered():
+                return [e for e in load_json() if e["unit_code"] == unit]
+
+            print(f"\n{len(entries)} entries")
+            full, _ = timed(load_json)
+            filtered, _ = timed(load_json_filtered)
+            print(f"  json     {os.path.getsize(json_path) / 1e6:8.2f} MB  "
+                  f"full {full * 1000:8.1f} ms  unit {filtered * 1000:8.1f} ms")
+
+            for ext in ("parquet", "feather"):
+                path = os.path.join(tmp, f"output.{ext}")
+                write_entries(entries, path)
+                full, _ = timed(lambda: load_entries(path))
+                by_unit, rows = timed(lambda: load_entries(path, unit_codes=[unit]))
+                by_date, _ = timed(lambda: load_entries(path, columns=["unit_code", "room"], dates=[date]))
+                print(f"  {ext:8s} {os.path.getsize(path) / 1e6:8.2f} MB  "
+                      f"full {full * 1000:8.1f} ms  unit {by_unit * 1000:8.1f} ms  "
+                      f"date(2 cols) {by_date * 1000:8.1f} ms  [{len(rows)} rows]")
+
+
+if __name__ == "__main__":
+    main()
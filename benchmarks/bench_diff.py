@@ -0,0 +1,37 @@
+"""Time diff_entries on two full-institution sized timetable versions."""
+import random
+import time
+
+from synthetic import generate_entries, TIMES
+from timetable_diff import diff_entries
+
+
+def revise(entries, rng, fraction=0.05):
+    """Copy a timetable and move a fraction of its entries to another time or room."""
+    revised = []
+    for item in entries:
+        item = dict(item)
+        if rng.random() < fraction:
+            if rng.random() < 0.5:
+                item["time"] = rng.choice(TIMES)
+            else:
+                item["room"] = f"R{rng.randrange(1000):03d}"
+        revised.append(item)
+    return revised
+
+
+def main():
+    rng = random.Random(3)
+    for n_units in (10000, 50000, 200000):
+        old = generate_entries(n_units, n_rooms=1000, n_weeks=6)
+        new = revise(old[: int(len(old) * 0.98)], rng)
+        new += generate_entries(n_units // 50, seed=99)
+
+        start = time.perf_counter()
+        report = diff_entries(iter(old), iter(new))
+        elapsed = time.perf_counter() - start
+        print(f"{len(old):7d} vs {len(new):7d} entries: {elapsed:6.2f} s  {report['summary']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Elective planning time for growing pools, against the number of combinations."""
+import math
+import random
+import time
+
+from synthetic import generate_entries
+from elective_planner import ElectivePlanner
+
+
+def main():
+    rng = random.Random(11)
+    # Three weeks of exams, as a typical exam period
+    entries = generate_entries(2000, n_weeks=3)
+    planner = ElectivePlanner(entries)
+    units = sorted(planner.unit_slots)
+
+    for pool_size, count in ((20, 3), (30, 4), (30, 6), (40, 6), (60, 6), (60, 8)):
+        timings, complete, best = [], 0, []
+        trials = 0
+        while trials < 5:
+            required = rng.sample(units, 4)
+            pool = rng.sample([u for u in units if u not in required], pool_size)
+            start = time.perf_counter()
+            try:
+                plans = planner.plan(required, pool, count)
+            except ValueError:
+                # Required units drawn at random may clash; draw again
+                continue
+            timings.append(time.perf_counter() - start)
+            complete += planner.last_search_complete
+            best.append(plans[0]["same_day_pairs"] if plans else None)
+            trials += 1
+
+        print(f"pool {pool_size:2d} choose {count}: {math.comb(pool_size, count):>12,d} combinations, "
+              f"median {sorted(timings)[len(timings) // 2] * 1000:7.1f} ms, "
+              f"max {max(timings) * 1000:7.1f} ms, {complete}/{trials} exhaustive, best same-day {best}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""Compare BK-tree "did you mean" lookups with a linear edit-distance scan."""
+import random
+import string
+import time
+
+from synthetic import generate_entries
+from fuzzy_index import FuzzyUnitIndex, edit_distance
+
+
+def typo(code, rng):
+    """Apply one random substitution, insertion or deletion."""
+    i = rng.randrange(len(code))
+    ch = rng.choice(string.ascii_uppercase + string.digits)
+    return rng.choice([
+        code[:i] + ch + code[i + 1:],
+        code[:i] + ch + code[i:],
+        code[:i] + code[i + 1:],
+    ])
+
+
+def main():
+    rng = random.Random(5)
+    for n_units in (1000, 5000, 20000):
+        codes = sorted(set(e["unit_code"] for e in generate_entries(n_units)))
+        start = time.perf_counter()
+        index = FuzzyUnitIndex(codes)
+        build = time.perf_counter() - start
+
+        queries = [typo(rng.choice(codes), rng) for _ in range(200)]
+        start = time.perf_counter()
+        for q in queries:
+            index.suggest(q)
+        tree = (time.perf_counter() - start) / len(queries)
+
+        start = time.perf_counter()
+        for q in queries[:20]:
+            sorted((edit_distance(q, c), c) for c in codes)[:5]
+        scan = (time.perf_counter() - start) / 20
+
+        print(f"{len(codes):6d} codes: build {build:5.2f} s, BK-tree {tree * 1000:6.2f} ms/query, "
+              f"linear scan {scan * 1000:7.2f} ms/query")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Drive TimetableGUI event handlers on synthetic datasets and report latencies.
+
+Needs a display; on a headless machine run it under Xvfb:
+
+    xvfb-run python benchmarks/bench_gui.py --output gui_latency.json
+"""
+import argparse
+import json
+import random
+import sys
+import time
+from types import SimpleNamespace
+
+from synthetic import generate_entries
+from latency_tracer import LatencyTracer
+import timetable_gui
+
+
+def drive(gui, units, rng, rounds=20):
+    """Replay a typical session: type, search, fill a basket, generate."""
+    for _ in range(rounds):
+        code = rng.choice(units)
+        gui.search_entry.delete(0, "end")
+        for ch in code:
+            gui.search_entry.insert("end", ch)
+            gui.on_search_key_release(SimpleNamespace(keysym=ch))
+        gui.search_unit_code()
+
+    gui.selected_units.clear()
+    gui.basket_listbox.delete(0, "end")
+    for code in rng.sample(units, min(8, len(units))):
+        gui.search_entry.delete(0, "end")
+        gui.search_entry.insert(0, code)
+        gui.add_to_basket()
+    for _ in range(rounds):
+        gui.generate_timetable()
+        gui.master.update_idletasks()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 2000, 10000],
+                        help="Number of units in each synthetic dataset")
+    parser.add_argument("--output", help="Write per-size latency summaries to this JSON file")
+    args = parser.parse_args()
+
+    try:
+        root = timetable_gui.tk.Tk()
+    except timetable_gui.tk.TclError as e:
+        print(f"No display available ({e}); run under xvfb-run.")
+        return 1
+    root.withdraw()
+
+    # Dialogs would block the scripted session. The stubs stand in for a user
+    # reading the dialog for 50 ms, which the tracer must leave out of handler
+    # latencies, so no p95 below should be near 50 ms because of them.
+    def read_dialog(*args, **kwargs):
+        time.sleep(0.05)
+
+    for name in ("showerror", "showinfo", "showwarning"):
+        setattr(timetable_gui.messagebox, name, read_dialog)
+
+    results = {}
+    rng = random.Random(1)
+    for n_units in args.sizes:
+        entries = generate_entries(n_units)
+        units = sorted(set(e["unit_code"] for e in entries))
+        frame = timetable_gui.tk.Toplevel(root)
+        tracer = LatencyTracer()
+        gui = timetable_gui.TimetableGUI(frame, entries, tracer=tracer)
+        drive(gui, units, rng)
+        frame.destroy()
+
+        results[len(entries)] = tracer.summary()
+        print(f"\n{len(entries)} entries")
+        for name, stats in results[len(entries)].items():
+            print(f"  {name:24s} n={stats['count']:4d}  p50 {stats['p50_ms']:8.2f} ms  "
+                  f"p95 {stats['p95_ms']:8.2f} ms  max {stats['max_ms']:8.2f} ms")
+
+    root.destroy()
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=4)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
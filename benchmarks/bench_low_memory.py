@@ -0,0 +1,89 @@
+"""
+Compare peak RSS of the default and low-memory mapping modes on large sheets.
+
+Each measurement runs in a fresh interpreter and reads VmHWM, the peak
+RSS of that interpreter alone; ru_maxrss would also count the parent's
+peak, which a vfork-started child inherits through exec. The baseline
+line is the interpreter with pandas and the mapper imported, before any
+workbook is read. Mapping hundreds of thousands of rows takes minutes, so
+the large workbooks are only loaded.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+from openpyxl import Workbook
+
+from synthetic import generate_sheet
+
+PEAK_RSS = """
+def peak_rss():
+    with open("/proc/self/status") as f:
+        return next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+"""
+
+BASELINE = PEAK_RSS + """
+import sys
+sys.path.insert(0, {root!r})
+import excel_mapper, xlsx_reader
+print(peak_rss())
+"""
+
+MEASURE = PEAK_RSS + """
+import logging, sys, time
+sys.path.insert(0, {root!r})
+logging.disable(logging.INFO)
+from excel_mapper import ExcelMapper
+start = time.perf_counter()
+mapper = ExcelMapper({path!r}, low_memory={low_memory})
+mapper.load_excel(engine={engine!r})
+load_peak = peak_rss()
+frame_bytes = mapper.dataframe.memory_usage(deep=True).sum()
+entries = mapper.map_headings() if {map_sheet} else []
+elapsed = time.perf_counter() - start
+print(load_peak, peak_rss(), len(entries), elapsed, frame_bytes)
+"""
+
+
+# (label, engine, low_memory)
+MODES = [("openpyxl", "openpyxl", False), ("sax", "sax", False), ("low-memory", "sax", True)]
+
+
+def write_workbook(path, n_sections):
+    """Write a synthetic sheet to an xlsx file, streaming it so large sheets fit in memory."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for row in generate_sheet(n_sections, fill=0.25).itertuples(index=False):
+        ws.append(list(row))
+    wb.save(path)
+
+
+def run(code):
+    """Run a measurement script in a fresh interpreter and return its output fields."""
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                          check=True).stdout.split()
+
+
+def main():
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    print(f"baseline: peak {int(run(BASELINE.format(root=root))[0]) / 1024:6.1f} MB")
+    with tempfile.TemporaryDirectory() as tmp:
+        # (sections, whether to map as well as load)
+        for n_sections, map_sheet in ((200, True), (5000, False), (15000, False)):
+            path = os.path.join(tmp, f"sheet_{n_sections}.xlsx")
+            write_workbook(path, n_sections)
+            print(f"{n_sections} sections, {os.path.getsize(path) / 1e6:.1f} MB workbook, "
+                  f"{'load and map' if map_sheet else 'load only'}:")
+            for label, engine, low_memory in MODES:
+                out = run(MEASURE.format(root=root, path=path, low_memory=low_memory,
+                                         engine=engine, map_sheet=map_sheet))
+                line = (f"  {label:>10}: peak {int(out[0]) / 1024:7.1f} MB after load, "
+                        f"frame {int(out[4]) / 1e6:7.1f} MB, {float(out[3]):6.1f} s")
+                if map_sheet:
+                    line += f", peak {int(out[1]) / 1024:7.1f} MB after mapping [{out[2]} entries]"
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
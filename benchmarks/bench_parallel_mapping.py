@@ -0,0 +1,34 @@
+"""Measure map_headings scaling as day-date sections and worker counts grow."""
+import logging
+import os
+import time
+
+from synthetic import generate_sheet
+from excel_mapper import ExcelMapper
+
+
+def main():
+    logging.getLogger("excel_mapper").setLevel(logging.WARNING)
+    cores = os.cpu_count() or 1
+    worker_counts = sorted(set([1, 2, 4, cores]))
+    print(f"{cores} CPU core(s) available")
+
+    for n_sections in (4, 16, 64):
+        mapper = ExcelMapper("synthetic.xlsx")
+        mapper.dataframe = generate_sheet(n_sections)
+        baseline = None
+        for workers in worker_counts:
+            start = time.perf_counter()
+            entries = mapper.map_headings(workers=workers)
+            elapsed = time.perf_counter() - start
+            if baseline is None:
+                baseline = (elapsed, entries)
+            assert entries == baseline[1], "parallel output differs from serial"
+            print(
+                f"{n_sections:3d} sections, {workers:2d} worker(s): {elapsed:7.2f} s "
+                f"({baseline[0] / elapsed:4.1f}x, {len(entries)} entries)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+"""Measure report sheets per second and peak Python memory as the sheet count grows."""
+import os
+import tempfile
+import time
+import tracemalloc
+
+from synthetic import generate_entries
+from report_writer import write_report
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rooms in (100, 1000, 5000):
+            # About six sittings per room
+            entries = generate_entries(n_rooms * 3, n_rooms=n_rooms, n_weeks=2)
+            path = os.path.join(tmp, "rooms.xlsx")
+
+            start = time.perf_counter()
+            sheets = write_report(entries, path, group_by="room")
+            elapsed = time.perf_counter() - start
+
+            # Traced separately: tracemalloc slows the write several times over
+            tracemalloc.start()
+            write_report(entries, path, group_by="room")
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(f"{sheets:5d} sheets, {len(entries):6d} entries: {elapsed:6.2f} s, "
+                  f"{sheets / elapsed:7.1f} sheets/s, peak {peak / 1e6:6.1f} MB, "
+                  f"file {os.path.getsize(path) / 1e6:5.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""Benchmark ReslotSolver build and suggestion time on growing exam periods."""
+import random
+import time
+
+from synthetic import generate_entries
+from reslot import ReslotSolver
+
+
+def main():
+    rng = random.Random(7)
+    for n_units in (500, 2000, 5000):
+        entries = generate_entries(n_units)
+        units = sorted(set(e["unit_code"] for e in entries))
+
+        start = time.perf_counter()
+        solver = ReslotSolver(entries)
+        build = time.perf_counter() - start
+
+        # Baskets of eight units, as a typical cohort load
+        baskets = [rng.sample(units, 8) for _ in range(200)]
+        start = time.perf_counter()
+        clashes = 0
+        for basket in baskets:
+            suggestions = solver.suggest_moves(basket)
+            clashes += bool(suggestions)
+        per_query = (time.perf_counter() - start) / len(baskets)
+
+        print(
+            f"{len(entries):6d} entries: build {build * 1000:7.1f} ms, "
+            f"suggest {per_query * 1000:6.2f} ms/basket ({clashes} baskets with clashes)"
+        )
+
+
+if __name__ == "__main__":
+    main()
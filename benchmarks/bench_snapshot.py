@@ -0,0 +1,61 @@
+"""Compare json.load with opening and querying a memory-mapped snapshot."""
+import json
+import os
+import tempfile
+import time
+
+from synthetic import generate_entries
+from snapshot import Snapshot, write_snapshot
+
+
+def timed(func, repeat=5):
+    """Return the best wall time of `repeat` calls and the last result."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_units in (2000, 20000, 100000):
+            entries = generate_entries(n_units, n_rooms=400, n_weeks=6)
+            unit = entries[len(entries) // 2]["unit_code"]
+            date = entries[0]["date"]
+
+            json_path = os.path.join(tmp, "output.json")
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=4, ensure_ascii=False)
+            snapshot_path = os.path.join(tmp, "output.wsnap")
+            write_snapshot(entries, snapshot_path)
+
+            def load_json():
+                with open(json_path, encoding="utf-8") as f:
+                    return json.load(f)
+
+            def open_snapshot():
+                snapshot = Snapshot(snapshot_path)
+                snapshot.close()
+
+            def query(method, key):
+                def run():
+                    with Snapshot(snapshot_path) as snapshot:
+                        return getattr(snapshot, method)(key)
+                return run
+
+            print(f"\n{len(entries)} entries")
+            full, _ = timed(load_json)
+            print(f"  json     {os.path.getsize(json_path) / 1e6:8.2f} MB  load {full * 1000:8.1f} ms")
+
+            opened, _ = timed(open_snapshot)
+            by_unit, rows = timed(query("by_unit", unit))
+            by_date, day_rows = timed(query("by_date", date))
+            print(f"  snapshot {os.path.getsize(snapshot_path) / 1e6:8.2f} MB  "
+                  f"open {opened * 1000:8.3f} ms  open+unit {by_unit * 1000:8.3f} ms [{len(rows)} rows]  "
+                  f"open+date {by_date * 1000:8.3f} ms [{len(day_rows)} rows]")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Compare the openpyxl and SAX reader engines on load time, checking equal output."""
+import logging
+import os
+import tempfile
+import time
+
+from synthetic import generate_sheet
+from excel_mapper import ExcelMapper
+
+
+def timed_load(path, engine):
+    """Best-of-three load time for one engine, with the loaded frame."""
+    best = float("inf")
+    for _ in range(3):
+        mapper = ExcelMapper(path)
+        start = time.perf_counter()
+        mapper.load_excel(engine=engine)
+        best = min(best, time.perf_counter() - start)
+    return best, mapper
+
+
+def main():
+    logging.getLogger("excel_mapper").setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_sections in (10, 50, 200):
+            path = os.path.join(tmp, f"sheet_{n_sections}.xlsx")
+            generate_sheet(n_sections).to_excel(path, index=False, header=False, engine="openpyxl")
+
+            openpyxl_time, reference = timed_load(path, "openpyxl")
+            sax_time, sax = timed_load(path, "sax")
+            same = reference.dataframe.equals(sax.dataframe)
+            print(
+                f"{n_sections:4d} sections {reference.dataframe.shape}: openpyxl {openpyxl_time:6.2f} s, "
+                f"sax {sax_time:6.2f} s ({openpyxl_time / sax_time:4.1f}x), identical frames: {same}"
+            )
+
+
+if __name__ == "__main__":
+    main()
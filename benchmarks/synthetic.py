@@ -0,0 +1,95 @@
+"""Synthetic timetable data shared by the benchmark scripts."""
+import os
+import random
+import sys
+from typing import List, Dict, Any
+
+import pandas as pd
+
+# Benchmarks run from the repository root or from this directory
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DAYS = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY"]
+TIMES = ["8:30AM-10:30AM", "11:00AM-1:00PM", "2:00PM-4:00PM", "4:30PM-6:30PM"]
+
+
+def generate_entries(n_units: int, n_rooms: int = 200, n_weeks: int = 3,
+                     seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    Generate mapped entries shaped like the output of ExcelMapper.map_headings.
+
+    Each unit sits once, in one to three rooms, in a random slot of the exam period.
+    """
+    rng = random.Random(seed)
+    slots = [
+        (day, f"{week * 7 + offset + 1:02d}/05/24", time)
+        for week in range(n_weeks)
+        for offset, day in enumerate(DAYS)
+        for time in TIMES
+    ]
+    rooms = [f"R{i:03d}" for i in range(n_rooms)]
+    entries = []
+    for u in range(n_units):
+        unit_code = f"{rng.choice(['COM', 'MAT', 'BUS', 'ENG', 'BIO'])}{u:04d}A"
+        day, date, time = rng.choice(slots)
+        for room in rng.sample(rooms, rng.randint(1, 3)):
+            entries.append({
+                "room": room,
+                "day": day,
+                "date": date,
+                "time": time,
+                "unit_code": unit_code,
+            })
+    return entries
+
+
+def generate_sheet(n_sections: int, rooms_per_section: int = 60, days_per_section: int = 5,
+                   fill: float = 0.5, seed: int = 42) -> pd.DataFrame:
+    """
+    Generate a raw sheet shaped like ExcelMapper.load_excel output.
+
+    The sheet is a stack of sections, each a day-date row, a time row headed
+    "ROOM" and one row per room, as in the registry's exam workbooks.
+    """
+    rng = random.Random(seed)
+    n_cols = 1 + days_per_section * len(TIMES)
+    rows = []
+    unit = 0
+    for section in range(n_sections):
+        day_row = [None] * n_cols
+        for d in range(days_per_section):
+            day_row[1 + d * len(TIMES)] = (
+                f"{DAYS[d % len(DAYS)]} {(section * 7 + d) % 28 + 1:02d}/05/24"
+            )
+        rows.append(day_row)
+        rows.append(["ROOM"] + TIMES * days_per_section)
+        for r in range(rooms_per_section):
+            row = [f"R{r:03d}"]
+            for _ in range(n_cols - 1):
+                if rng.random() < fill:
+                    unit += 1
+                    row.append(f"COM{unit % 5000:04d}A")
+                else:
+                    row.append(None)
+            rows.append(row)
+    return pd.DataFrame(rows, columns=[f"Unnamed: {i}" for i in range(n_cols)], dtype=object)
+
+
+def generate_enrolments(unit_codes: List[str], n_students: int, units_per_student: int = 6,
+                        programme_size: int = 40, seed: int = 42) -> pd.DataFrame:
+    """
+    Generate (student_id, unit_code) enrolments.
+
+    Students belong to programmes, each a block of consecutive unit codes, so
+    units in a programme share many students as in real cohorts.
+    """
+    rng = random.Random(seed)
+    n_programmes = max(1, len(unit_codes) // programme_size)
+    students, units = [], []
+    for s in range(n_students):
+        p = rng.randrange(n_programmes)
+        block = unit_codes[p * programme_size:(p + 1) * programme_size]
+        for unit in rng.sample(block, min(units_per_student, len(block))):
+            students.append(f"S{s:06d}")
+            units.append(unit)
+    return pd.DataFrame({"student_id": students, "unit_code": units})
@@ -0,0 +1,71 @@
+import json
+import logging
+import os
+import sys
+import tempfile
+
+from archive_store import ArchiveStore
+from snapshot import write_snapshot
+
+ENTRIES = [
+    {"room": "LT1", "day": "MONDAY", "date": "09/12/24", "time": "9:00AM-11:00AM", "unit_code": "AB 12"},
+    {"room": "LT2", "day": "TUESDAY", "date": "10/12/24", "time": "9:00AM-11:00AM", "unit_code": "cd34"},
+]
+
+
+def check_term(store, term, query, expected_entries):
+    """
+    Check that the unit index and the loaded term agree on a unit.
+
+    :param store: Archive holding the term
+    :param term: Term name
+    :param query: Unit code as a user would type it
+    :param expected_entries: Number of entries the term holds for the unit
+    :return: List of problem descriptions, empty if the check passes
+    """
+    problems = []
+    if term not in store.terms_for_unit(query):
+        problems.append(f"{query}: index does not list {term}")
+    found = store.unit_history(query).get(term, [])
+    if len(found) != expected_entries:
+        problems.append(f"{query}: {term} returned {len(found)} entries, expected {expected_entries}")
+    return problems
+
+
+def check_archive():
+    """
+    Register the same entries as a snapshot term and a JSON term, then look
+    up spaced and lower-case codes by their normalized form and vice versa.
+
+    :return: List of problem descriptions, empty if the check passes
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        snapshot_path = os.path.join(tmp, "term.wsnap")
+        json_path = os.path.join(tmp, "term.json")
+        write_snapshot(ENTRIES, snapshot_path)
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(ENTRIES, f)
+
+        store = ArchiveStore()
+        store.register("SNAP", snapshot_path)
+        store.register("JSON", json_path)
+
+        problems = []
+        for term in ("SNAP", "JSON"):
+            for query in ("AB12", "ab 12", "CD34", "Cd 34"):
+                problems.extend(check_term(store, term, query, 1))
+        store.close()
+    return problems
+
+
+# Example usage
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+
+    problems = check_archive()
+    if problems:
+        print("❌ check_archive")
+        for problem in problems:
+            print(f"   {problem}")
+        sys.exit(1)
+    print("✓ check_archive: snapshot and JSON terms agree with the unit index")
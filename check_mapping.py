@@ -0,0 +1,70 @@
+import logging
+import sys
+from collections import Counter
+
+from excel_mapper import ExcelMapper
+
+# Entries per exam date in the sample workbooks, as mapped when each unit
+# code only takes the day-dates of its own section
+EXPECTED_DATES = {
+    "exam.xlsx": {
+        "09/12/24": 60, "10/12/24": 62, "11/12/24": 58, "13/12/24": 57,
+        "16/12/24": 60, "17/12/24": 49, "18/12/24": 49, "19/12/24": 56,
+        "20/12/24": 38,
+    },
+    "exam2.xlsx": {
+        "15/04/24": 64, "16/04/24": 55, "17/04/24": 59, "18/04/24": 43,
+        "19/04/24": 52, "22/04/24": 47, "23/04/24": 37, "24/04/24": 48,
+        "25/04/24": 42, "26/04/24": 37,
+    },
+}
+EXPECTED_COUNTS = {"exam.xlsx": 489, "exam2.xlsx": 484}
+
+# (engine, low_memory) combinations that must all map the same entries
+MODES = [("openpyxl", False), ("sax", False), ("sax", True)]
+
+
+def check_workbook(filepath, engine="openpyxl", low_memory=False):
+    """
+    Map a sample workbook and compare its entry count and date distribution.
+
+    :param filepath: Path to one of the sample workbooks
+    :param engine: Excel reader engine
+    :param low_memory: Map in low-memory mode
+    :return: List of mismatch descriptions, empty if the mapping is as expected
+    """
+    mapper = ExcelMapper(filepath, low_memory=low_memory)
+    mapper.load_excel(engine=engine)
+    entries = mapper.map_headings()
+
+    problems = []
+    if len(entries) != EXPECTED_COUNTS[filepath]:
+        problems.append(f"{len(entries)} entries, expected {EXPECTED_COUNTS[filepath]}")
+
+    dates = Counter(item["date"] for item in entries)
+    for date in sorted(set(dates) | set(EXPECTED_DATES[filepath])):
+        if dates.get(date, 0) != EXPECTED_DATES[filepath].get(date, 0):
+            problems.append(f"{date}: {dates.get(date, 0)} entries, "
+                            f"expected {EXPECTED_DATES[filepath].get(date, 0)}")
+    return problems
+
+
+# Example usage
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+
+    failures = 0
+    for filepath in EXPECTED_COUNTS:
+        for engine, low_memory in MODES:
+            label = f"{filepath} ({engine}{', low memory' if low_memory else ''})"
+            problems = check_workbook(filepath, engine, low_memory)
+            if problems:
+                failures += 1
+                print(f"❌ {label}")
+                for problem in problems:
+                    print(f"   {problem}")
+            else:
+                print(f"✓ {label}: {EXPECTED_COUNTS[filepath]} entries over "
+                      f"{len(EXPECTED_DATES[filepath])} dates")
+
+    sys.exit(1 if failures else 0)
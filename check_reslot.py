@@ -0,0 +1,90 @@
+import logging
+import sys
+
+from reslot import ReslotSolver
+from time_slots import parse_time_range
+
+
+def entry(unit_code, date, time, room):
+    """A mapped timetable entry."""
+    return {"unit_code": unit_code, "date": date, "day": "MONDAY", "time": time, "room": room}
+
+
+def overlaps(a, b):
+    """Whether two suggested or scheduled (date, time) placements overlap."""
+    if a[0] != b[0]:
+        return False
+    start_a, end_a = parse_time_range(a[1])
+    start_b, end_b = parse_time_range(b[1])
+    return start_a < end_b and start_b < end_a
+
+
+def check_overlapping_labels():
+    """
+    Moves must avoid cohort exams whose time ranges overlap, not just exams
+    with the same slot label.
+
+    :return: List of problem descriptions, empty if the check passes
+    """
+    timetable = [
+        entry("A", "01/01/25", "9:00AM-11:00AM", "R1"),
+        entry("B", "01/01/25", "9:00AM-11:00AM", "R2"),
+        entry("C", "02/01/25", "10:00AM-12:00PM", "R3"),
+        # Another cohort's exam, so the 9:00AM-11:00AM slot exists on 02/01
+        entry("D", "02/01/25", "9:00AM-11:00AM", "R4"),
+    ]
+    solver = ReslotSolver(timetable)
+    problems = []
+
+    # Overlapping but differently labelled slots are a clash too
+    clashes = solver.find_clashes(["A", "C", "D"])
+    if sorted(unit for units in clashes.values() for unit in units) != ["C", "D"]:
+        problems.append(f"find_clashes missed an overlap: {clashes}")
+
+    for suggestion in solver.suggest_moves(["A", "B", "C"]):
+        if overlaps((suggestion["date"], suggestion["time"]), ("02/01/25", "10:00AM-12:00PM")):
+            problems.append(f"{suggestion['unit_code']} moved to {suggestion['date']} "
+                            f"{suggestion['time']}, overlapping C")
+    return problems
+
+
+def check_moves_do_not_collide():
+    """
+    The first suggestions for two units leaving the same clash must not
+    send both units to the same slot.
+
+    :return: List of problem descriptions, empty if the check passes
+    """
+    timetable = [
+        entry("A", "01/01/25", "9:00AM-11:00AM", "R1"),
+        entry("B", "01/01/25", "9:00AM-11:00AM", "R2"),
+        entry("D", "03/01/25", "9:00AM-11:00AM", "R3"),
+        entry("E", "04/01/25", "9:00AM-11:00AM", "R4"),
+    ]
+    best = {}
+    for suggestion in ReslotSolver(timetable).suggest_moves(["A", "B"]):
+        best.setdefault(suggestion["unit_code"], (suggestion["date"], suggestion["time"]))
+
+    if set(best) != {"A", "B"}:
+        return [f"expected suggestions for A and B, got {sorted(best)}"]
+    if overlaps(best["A"], best["B"]):
+        return [f"A and B both moved to {best['A'][0]} {best['A'][1]}"]
+    return []
+
+
+# Example usage
+if __name__ == "__main__":
+    logging.disable(logging.INFO)
+
+    failures = 0
+    for check in (check_overlapping_labels, check_moves_do_not_collide):
+        problems = check()
+        if problems:
+            failures += 1
+            print(f"❌ {check.__name__}")
+            for problem in problems:
+                print(f"   {problem}")
+        else:
+            print(f"✓ {check.__name__}")
+
+    sys.exit(1 if failures else 0)
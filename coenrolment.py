@@ -0,0 +1,207 @@
+"""
+Rank exam clashes across all units from student enrolments.
+
+A sparse unit x student incidence matrix A is built from an enrolment file,
+so A @ A.T counts the students shared by every pair of units. A second
+sparse product, O @ V @ O.T, marks the pairs whose exams overlap in time,
+where O is the unit x slot schedule and V is the slot x slot overlap
+matrix. Their element-wise product is the clash matrix: unit pairs that
+share students and overlapping slots.
+"""
+import argparse
+import csv
+import json
+import sys
+from collections import defaultdict
+from typing import Iterable, List, Dict, Tuple, Optional, Any
+import logging
+
+import numpy as np
+import pandas as pd
+
+try:
+    import scipy.sparse as sp
+except ImportError:
+    sp = None
+
+from time_slots import SlotIndex, iter_bits
+
+logger = logging.getLogger(__name__)
+
+
+def _require_scipy() -> None:
+    """Raise a helpful error when the optional scipy dependency is missing."""
+    if sp is None:
+        raise ImportError(
+            "The co-enrolment clash matrix requires scipy. Install it with: pip install scipy"
+        )
+
+
+def load_enrolments(path: str) -> pd.DataFrame:
+    """
+    Load an enrolment file with one row per (student_id, unit_code).
+
+    CSV and Excel files are accepted; unit codes are normalized like the
+    mapper's output (spaces removed, upper case).
+    """
+    try:
+        if path.lower().endswith((".xlsx", ".xls")):
+            df = pd.read_excel(path, engine="openpyxl", dtype=str)
+        else:
+            df = pd.read_csv(path, dtype=str)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Enrolment file not found: {path}")
+    except Exception as e:
+        raise ValueError(f"Failed to load the enrolment file. Error: {e}")
+
+    missing = {"student_id", "unit_code"} - set(df.columns)
+    if missing:
+        raise ValueError(f"Enrolment file is missing columns: {', '.join(sorted(missing))}")
+
+    df = df[["student_id", "unit_code"]].dropna()
+    df["unit_code"] = df["unit_code"].str.replace(" ", "", regex=False).str.upper()
+    return df
+
+
+class ClashMatrix:
+    """Sparse co-enrolment and slot-overlap matrices over a shared unit index."""
+
+    def __init__(self, timetable_data: Iterable[Dict[str, Any]], enrolments: pd.DataFrame):
+        _require_scipy()
+
+        # Slots and the units sitting in each, from the mapped schedule
+        self.slot_index = SlotIndex()
+        unit_slots = defaultdict(set)
+        for item in timetable_data:
+            unit_slots[item["unit_code"].upper()].add(self.slot_index.add(item))
+        self.slots: List[Tuple[str, str, str]] = self.slot_index.slots
+
+        # Only scheduled units can clash; others are dropped from the enrolments
+        self.units = sorted(unit_slots)
+        self.unit_index = {unit: i for i, unit in enumerate(self.units)}
+        enrolments = enrolments[enrolments["unit_code"].isin(self.unit_index)].drop_duplicates()
+        student_codes, students = pd.factorize(enrolments["student_id"])
+        unit_codes = enrolments["unit_code"].map(self.unit_index).to_numpy()
+
+        n_units, n_students = len(self.units), len(students)
+        self.incidence = sp.csr_matrix(
+            (np.ones(len(unit_codes), dtype=np.int32), (unit_codes, student_codes)),
+            shape=(n_units, n_students),
+        )
+
+        rows = [self.unit_index[unit] for unit, slots in unit_slots.items() for _ in slots]
+        cols = [slot for slots in unit_slots.values() for slot in slots]
+        self.schedule = sp.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(n_units, len(self.slots)),
+        )
+        self.overlap = self._slot_overlap_matrix()
+        logger.info(
+            f"Clash matrix over {n_units} units, {n_students} students and {len(self.slots)} slots"
+        )
+
+    def _slot_overlap_matrix(self) -> "sp.csr_matrix":
+        """Slot x slot matrix marking slots on the same date whose times overlap."""
+        rows, cols = [], []
+        for i, mask in enumerate(self.slot_index.overlap_masks()):
+            for j in iter_bits(mask):
+                rows.append(i)
+                cols.append(j)
+
+        return sp.csr_matrix(
+            (np.ones(len(rows), dtype=np.int32), (rows, cols)),
+            shape=(len(self.slots), len(self.slots)),
+        )
+
+    def co_enrolment(self) -> "sp.csr_matrix":
+        """Unit x unit matrix of shared student counts (upper triangle only)."""
+        return sp.triu(self.incidence @ self.incidence.T, k=1, format="csr")
+
+    def clashes(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Rank unit pairs that share students and sit in overlapping slots.
+
+        Args:
+            limit: Maximum number of pairs to return (all if omitted)
+
+        Returns:
+            List of clash dictionaries, most shared students first
+        """
+        co_enrolled = self.co_enrolment()
+        overlapping = self.schedule @ self.overlap @ self.schedule.T
+        clash = co_enrolled.multiply(overlapping > 0).tocoo()
+
+        order = np.lexsort((clash.col, clash.row, -clash.data))
+        if limit is not None:
+            order = order[:limit]
+
+        results = []
+        for k in order:
+            a, b = int(clash.row[k]), int(clash.col[k])
+            results.append({
+                "unit_a": self.units[a],
+                "unit_b": self.units[b],
+                "students": int(clash.data[k]),
+                "slots": self._overlapping_slots(a, b),
+            })
+        return results
+
+    def _overlapping_slots(self, a: int, b: int) -> List[Dict[str, str]]:
+        """Describe the overlapping slot pairs of two units."""
+        slots_a = self.schedule.indices[self.schedule.indptr[a]:self.schedule.indptr[a + 1]]
+        slots_b = set(self.schedule.indices[self.schedule.indptr[b]:self.schedule.indptr[b + 1]])
+        described = []
+        for i in slots_a:
+            overlaps = self.overlap.indices[self.overlap.indptr[i]:self.overlap.indptr[i + 1]]
+            for j in overlaps:
+                if j in slots_b:
+                    date, day, time_a = self.slots[i]
+                    described.append({
+                        "day": day, "date": date,
+                        "time_a": time_a, "time_b": self.slots[j][2],
+                    })
+        return described
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Write a ranked clash list for a timetable and an enrolment file."""
+    from timetable_diff import iter_entries
+
+    parser = argparse.ArgumentParser(description="Rank exam clashes from student enrolments.")
+    parser.add_argument("timetable", help="Workbook or mapped export (JSON, Parquet, Feather)")
+    parser.add_argument("enrolments", help="CSV or Excel file with student_id and unit_code columns")
+    parser.add_argument("-n", "--limit", type=int, help="Only report the top N clashing pairs")
+    parser.add_argument("-o", "--output", help="Write the clash list here (.json or .csv)")
+    args = parser.parse_args(argv)
+
+    try:
+        matrix = ClashMatrix(iter_entries(args.timetable), load_enrolments(args.enrolments))
+        clashes = matrix.clashes(limit=args.limit)
+    except (FileNotFoundError, ValueError, ImportError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.output and args.output.lower().endswith(".csv"):
+        with open(args.output, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Unit A", "Unit B", "Students", "Day", "Date", "Time A", "Time B"])
+            for clash in clashes:
+                for slot in clash["slots"]:
+                    writer.writerow([
+                        clash["unit_a"], clash["unit_b"], clash["students"],
+                        slot["day"], slot["date"], slot["time_a"], slot["time_b"],
+                    ])
+    elif args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(clashes, f, indent=4, ensure_ascii=False)
+    else:
+        for clash in clashes:
+            print(f"{clash['unit_a']} / {clash['unit_b']}: {clash['students']} students")
+
+    if args.output:
+        print(f"✓ {len(clashes)} clashing pairs written to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,171 @@
+import os
+from typing import List, Dict, Optional, Any
+import logging
+
+from time_slots import normalize_unit_code
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.dataset as ds
+    import pyarrow.feather as feather
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+logger = logging.getLogger(__name__)
+
+# Column order of a mapped timetable entry
+ENTRY_COLUMNS = ["room", "day", "date", "time", "unit_code"]
+# Written only when some entry has them, e.g. the source workbook of a merged batch
+OPTIONAL_COLUMNS = ["source"]
+
+# Small row groups keep date/unit filters selective on a single timetable
+DEFAULT_ROW_GROUP_SIZE = 4096
+
+
+def _require_pyarrow() -> None:
+    """Raise a helpful error when the optional pyarrow dependency is missing."""
+    if pa is None:
+        raise ImportError(
+            "Columnar export requires pyarrow. Install it with: pip install pyarrow"
+        )
+
+
+def _file_format(path: str, file_format: Optional[str]) -> str:
+    """Resolve the columnar format from an explicit name or the file extension."""
+    if file_format is None:
+        file_format = os.path.splitext(path)[1].lstrip(".").lower()
+    if file_format in ("parquet", "pq"):
+        return "parquet"
+    if file_format in ("feather", "arrow", "ipc"):
+        return "feather"
+    raise ValueError(f"Unsupported columnar format: {file_format or path}")
+
+
+def entries_to_table(data: List[Dict[str, Any]]) -> "pa.Table":
+    """
+    Build an Arrow table from mapped entries with dictionary-encoded columns.
+
+    Rows are sorted by date then unit code so row group statistics stay
+    narrow and filters on either column can skip whole groups.
+    """
+    _require_pyarrow()
+    rows = sorted(data, key=lambda item: (item["date"], item["unit_code"]))
+    columns = ENTRY_COLUMNS + [
+        column for column in OPTIONAL_COLUMNS if any(column in item for item in rows)
+    ]
+    arrays = [
+        pa.array([item.get(column) for item in rows], type=pa.string()).dictionary_encode()
+        for column in columns
+    ]
+    return pa.Table.from_arrays(arrays, names=columns)
+
+
+def write_entries(data: List[Dict[str, Any]], output_path: str,
+                  file_format: Optional[str] = None,
+                  row_group_size: int = DEFAULT_ROW_GROUP_SIZE) -> None:
+    """
+    Write mapped entries to a Parquet or Feather file.
+
+    Args:
+        data: Mapped timetable entries
+        output_path: Destination file
+        file_format: "parquet" or "feather"; inferred from the extension if omitted
+        row_group_size: Rows per Parquet row group or Feather record batch
+    """
+    file_format = _file_format(output_path, file_format)
+    table = entries_to_table(data)
+
+    if file_format == "parquet":
+        # Parquet dictionary-encodes each column chunk itself; writing Arrow
+        # dictionaries would repeat the full dictionary in every row group
+        table = table.cast(pa.schema([(column, pa.string()) for column in table.column_names]))
+        pq.write_table(
+            table, output_path, row_group_size=row_group_size,
+            use_dictionary=True, write_statistics=True, compression="zstd",
+        )
+    else:
+        feather.write_feather(
+            table, output_path, chunksize=row_group_size, compression="zstd"
+        )
+    logger.info(f"Wrote {len(data)} entries to {output_path} ({file_format})")
+
+
+def load_entries(path: str, columns: Optional[List[str]] = None,
+                 unit_codes: Optional[List[str]] = None,
+                 dates: Optional[List[str]] = None,
+                 file_format: Optional[str] = None) -> List[Dict[str, Any]]:
+    """
+    Load mapped entries from a Parquet or Feather file.
+
+    Only the requested columns are read, and the filters are pushed down to
+    the scanner; the date filter also skips row groups that cannot match.
+    Unit codes are matched case-insensitively and without spaces, like
+    everywhere else in the application.
+
+    Args:
+        path: File written by write_entries
+        columns: Columns to return (all stored columns if omitted)
+        unit_codes: Only return entries for these unit codes
+        dates: Only return entries on these dates; an empty list of unit
+            codes or dates matches nothing
+
+    Returns:
+        List of dictionaries containing timetable entries
+    """
+    _require_pyarrow()
+    file_format = _file_format(path, file_format)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"Columnar file not found: {path}")
+
+    if file_format == "parquet":
+        source_format = ds.ParquetFileFormat(
+            read_options={"dictionary_columns": ENTRY_COLUMNS + OPTIONAL_COLUMNS}
+        )
+    else:
+        source_format = "ipc"
+    try:
+        dataset = ds.dataset(path, format=source_format)
+    except Exception as e:
+        raise ValueError(f"Failed to open columnar file {path}. Error: {e}")
+
+    columns = list(columns or dataset.schema.names)
+    unknown = [column for column in columns if column not in dataset.schema.names]
+    if unknown:
+        raise ValueError(f"Unknown columns: {', '.join(unknown)}. "
+                         f"Available columns: {', '.join(dataset.schema.names)}")
+    if (unit_codes is not None and not unit_codes) or (dates is not None and not dates):
+        return []
+
+    expression = None
+    if unit_codes is not None:
+        # Stored codes keep their original case, so both sides are normalized
+        stored = ds.field("unit_code").cast(pa.string())
+        normalized = pc.utf8_upper(pc.replace_substring(stored, " ", ""))
+        wanted = pa.array({normalize_unit_code(str(code)) for code in unit_codes}, type=pa.string())
+        expression = normalized.isin(wanted)
+    if dates is not None:
+        date_filter = ds.field("date").isin(pa.array([str(date) for date in dates], type=pa.string()))
+        expression = date_filter if expression is None else expression & date_filter
+
+    table = dataset.to_table(columns=columns, filter=expression)
+    return table_to_entries(table)
+
+
+def table_to_entries(table: "pa.Table") -> List[Dict[str, Any]]:
+    """Convert an Arrow table back into a list of entry dictionaries."""
+    names = table.column_names
+    columns = []
+    for name in names:
+        column = table.column(name)
+        if pa.types.is_dictionary(column.type):
+            # Decode through the dictionary so each distinct string is built once
+            values = []
+            for chunk in column.chunks:
+                dictionary = chunk.dictionary.to_pylist()
+                values.extend(dictionary[i] for i in chunk.indices.to_pylist())
+            columns.append(values)
+        else:
+            columns.append(column.to_pylist())
+    return [dict(zip(names, row)) for row in zip(*columns)]
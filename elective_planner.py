@@ -0,0 +1,268 @@
+"""
+Find clash-free elective combinations for a set of required units.
+
+Each unit's exam slots become a bitmask over (date, time) slots, and each
+unit also gets a "blocked" mask of every slot overlapping its own, so two
+units clash exactly when one's slots meet the other's blocked mask.
+Electives are then chosen depth-first, carrying a bitmask of the electives
+still compatible with everything chosen so far, and branches are cut when
+too few compatible electives remain or when the partial spread score can
+no longer beat the worst combination kept.
+"""
+import datetime
+import heapq
+import time
+from collections import defaultdict
+from typing import Iterable, List, Dict, Tuple, Optional, Any
+import logging
+
+from time_slots import SlotIndex, iter_bits
+
+logger = logging.getLogger(__name__)
+
+
+def _popcount(mask: int) -> int:
+    return bin(mask).count("1")
+
+
+def _date_ordinal(date: str) -> Optional[int]:
+    """Day number of a "DD/MM/YY" date, or None if it cannot be parsed."""
+    try:
+        return datetime.datetime.strptime(date, "%d/%m/%y").toordinal()
+    except ValueError:
+        return None
+
+
+class ElectivePlanner:
+    """
+    Rank clash-free elective combinations by how well exams are spread.
+
+    A combination scores (same-day pairs, consecutive-day pairs) over all
+    of its exams, required units included; lower is better. Both counts
+    only grow as units are added, so a partial combination's score is a
+    lower bound for every combination that extends it.
+    """
+
+    def __init__(self, timetable_data: Iterable[Dict[str, Any]]):
+        slot_index = SlotIndex()
+        self.unit_slots: Dict[str, int] = defaultdict(int)
+        for item in timetable_data:
+            self.unit_slots[item["unit_code"].upper()] |= 1 << slot_index.add(item)
+        self.slots: List[Tuple[str, str, str]] = slot_index.slots
+
+        # Dates in calendar order (unparsable dates last) and whether each is
+        # followed by the next calendar day
+        dates = sorted({date for date, _, _ in self.slots},
+                       key=lambda date: (_date_ordinal(date) is None, _date_ordinal(date) or 0, date))
+        self.dates = dates
+        ordinals = [_date_ordinal(date) for date in dates]
+        self.next_is_consecutive = [
+            i + 1 < len(dates) and ordinals[i] is not None and ordinals[i + 1] == ordinals[i] + 1
+            for i in range(len(dates))
+        ]
+        date_index = {date: i for i, date in enumerate(dates)}
+        slot_dates = [date_index[date] for date, _, _ in self.slots]
+
+        # Per unit: slots blocked by its exams, and its exams per date
+        overlap_masks = slot_index.overlap_masks()
+        self.blocked: Dict[str, int] = {}
+        self.unit_days: Dict[str, List[Tuple[int, int]]] = {}
+        for unit, mask in self.unit_slots.items():
+            blocked = 0
+            per_day: Dict[int, int] = defaultdict(int)
+            for slot in iter_bits(mask):
+                blocked |= overlap_masks[slot]
+                per_day[slot_dates[slot]] += 1
+            self.blocked[unit] = blocked
+            self.unit_days[unit] = sorted(per_day.items())
+        self.last_search_complete = True
+        logger.debug(f"Elective planner built over {len(self.unit_slots)} units and {len(self.slots)} slots")
+
+    def _add_unit(self, day_counts: List[int], unit: str) -> Tuple[int, int, List[int]]:
+        """Same-day and consecutive-day pairs a unit adds, and the updated exams per date."""
+        counts = list(day_counts)
+        same_day = next_day = 0
+        for d, added in self.unit_days[unit]:
+            same_day += counts[d] * added + added * (added - 1) // 2
+            if d > 0 and self.next_is_consecutive[d - 1]:
+                next_day += added * counts[d - 1]
+            if self.next_is_consecutive[d]:
+                next_day += added * counts[d + 1]
+            counts[d] += added
+        return same_day, next_day, counts
+
+    def _check_units(self, unit_codes: Iterable[str]) -> List[str]:
+        """Normalize unit codes and reject any that are not in the timetable."""
+        units = []
+        for code in unit_codes:
+            unit = code.replace(" ", "").upper()
+            if unit and unit not in units:
+                units.append(unit)
+        missing = [unit for unit in units if unit not in self.unit_slots]
+        if missing:
+            raise ValueError(f"Unit codes not found in timetable data: {', '.join(missing)}")
+        return units
+
+    def plan(self, required: List[str], electives: List[str], count: int,
+             max_results: int = 10, time_limit: Optional[float] = 1.0) -> List[Dict[str, Any]]:
+        """
+        Find the best-spread clash-free ways to add `count` electives.
+
+        Args:
+            required: Units that must be taken
+            electives: Pool of candidate electives
+            count: Number of electives to choose
+            max_results: Number of combinations to return
+            time_limit: Seconds to search before returning the best found so
+                far (None searches exhaustively). Trying the cheapest
+                electives first means the best combinations are usually found
+                early; most of a long search goes on proving none is better.
+
+        Returns:
+            Combinations, best first, each with the chosen electives, the
+            same-day and consecutive-day pair counts and exams per date.
+            self.last_search_complete tells whether the search was exhaustive.
+        """
+        required = self._check_units(required)
+        pool = [unit for unit in self._check_units(electives) if unit not in required]
+        if count < 0:
+            raise ValueError("The number of electives must not be negative")
+        if count > len(pool):
+            raise ValueError(f"Cannot choose {count} electives from a pool of {len(pool)}")
+
+        # Required units must not clash among themselves
+        blocked = 0
+        day_counts = [0] * len(self.dates)
+        base = (0, 0)
+        for unit in required:
+            if self.unit_slots[unit] & blocked:
+                clashing = [u for u in required if u != unit and self.unit_slots[u] & self.blocked[unit]]
+                raise ValueError(f"Required units clash: {unit} with {', '.join(clashing)}")
+            same, nxt, day_counts = self._add_unit(day_counts, unit)
+            base = (base[0] + same, base[1] + nxt)
+            blocked |= self.blocked[unit]
+
+        # Electives clashing with a required unit are out; the rest get a
+        # bitmask of the other electives they can be taken with
+        pool = [unit for unit in pool if not self.unit_slots[unit] & blocked]
+        n = len(pool)
+        compatible = [0] * n
+        for i in range(n):
+            for j in range(i + 1, n):
+                if not self.unit_slots[pool[i]] & self.blocked[pool[j]]:
+                    compatible[i] |= 1 << j
+                    compatible[j] |= 1 << i
+
+        # Electives with an exam on each date, for the same-day bound
+        date_electives = [0] * len(self.dates)
+        for i, unit in enumerate(pool):
+            for d, _ in self.unit_days[unit]:
+                date_electives[d] |= 1 << i
+
+        def extra_same_day(candidates: int, counts: List[int], need: int) -> Optional[int]:
+            """
+            Fewest same-day pairs `need` more electives could add.
+
+            Each elective adds at least one exam, on a date where some
+            candidate sits, so filling the emptiest such dates first gives a
+            lower bound. None means the candidates cannot cover `need` picks.
+            """
+            room = [_popcount(candidates & mask) for mask in date_electives]
+            fill = list(counts)
+            added = 0
+            for _ in range(need):
+                open_days = [d for d in range(len(fill)) if room[d]]
+                if not open_days:
+                    return None
+                d = min(open_days, key=fill.__getitem__)
+                added += fill[d]
+                fill[d] += 1
+                room[d] -= 1
+            return added
+
+        # Min-heap keyed on the negated score, so the worst kept combination
+        # (ties broken against the later find) is on top
+        best: List[Tuple[int, int, int, List[str], List[int]]] = []
+        found = 0
+
+        def worst_kept() -> Optional[Tuple[int, int]]:
+            return (-best[0][0], -best[0][1]) if len(best) == max_results else None
+
+        deadline = None if time_limit is None else time.perf_counter() + time_limit
+        self.last_search_complete = True
+
+        def search(candidates: int, chosen: List[str], counts: List[int], score: Tuple[int, int]) -> None:
+            nonlocal found
+            if deadline is not None and time.perf_counter() > deadline:
+                self.last_search_complete = False
+                return
+            need = count - len(chosen)
+            if need == 0:
+                entry = (-score[0], -score[1], -found, list(chosen), counts)
+                found += 1
+                if len(best) < max_results:
+                    heapq.heappush(best, entry)
+                else:
+                    heapq.heapreplace(best, entry)
+                return
+            if _popcount(candidates) < need:
+                return
+
+            # What each candidate would add now; counts only grow, so it can
+            # add no less later. Cheapest candidates are tried first.
+            moves = []
+            for i in iter_bits(candidates):
+                same, nxt, new_counts = self._add_unit(counts, pool[i])
+                moves.append((same, nxt, i, new_counts))
+            moves.sort()
+
+            # Scores only grow, so a branch whose lower bound cannot beat the
+            # worst kept combination is cut
+            worst = worst_kept()
+            if worst is not None:
+                extra = extra_same_day(candidates, counts, need)
+                if extra is None:
+                    return
+                bound = (
+                    score[0] + max(extra, sum(sorted(m[0] for m in moves)[:need])),
+                    score[1] + sum(sorted(m[1] for m in moves)[:need]),
+                )
+                if bound >= worst:
+                    return
+
+            for same, nxt, i, new_counts in moves:
+                candidates &= ~(1 << i)
+                child = (score[0] + same, score[1] + nxt)
+                worst = worst_kept()
+                if worst is not None and child >= worst:
+                    # Moves are sorted, so later siblings cannot beat it either
+                    break
+                # Electives left for this branch: compatible with everything
+                # chosen, including i, and not already tried at this level
+                remaining = candidates & compatible[i]
+                if _popcount(remaining) < need - 1:
+                    continue
+                chosen.append(pool[i])
+                search(remaining, chosen, new_counts, child)
+                chosen.pop()
+                if not self.last_search_complete:
+                    return
+                if _popcount(candidates) < need:
+                    break
+
+        if max_results > 0:
+            search((1 << n) - 1, [], day_counts, base)
+
+        results = []
+        for same, nxt, _, chosen, counts in sorted(best, reverse=True):
+            results.append({
+                "electives": chosen,
+                "same_day_pairs": -same,
+                "consecutive_day_pairs": -nxt,
+                "exams_per_day": {date: c for date, c in zip(self.dates, counts) if c},
+            })
+        logger.info(
+            f"Planned {len(results)} combinations of {count} from {n} compatible electives"
+            + ("" if self.last_search_complete else f" (best found in {time_limit} s)")
+        )
+        return results
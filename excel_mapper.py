@@ -8,6 +8,9 @@ import logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cells such as "MONDAY 22/04/24" that head a day-date column range
+DAY_DATE_PATTERN = r"^[A-Za-z]+\s+\d{2}/\d{2}/\d{2,4}$"
+
 
 class ExcelMapper:
     """
@@ -15,16 +18,51 @@ class ExcelMapper:
     Handles day-date rows, time mapping, and room assignments.
     """
     
-    def __init__(self, filepath: str):
+    def __init__(self, filepath: str, low_memory: bool = False):
+        """
+        Args:
+            filepath: Path to the Excel workbook
+            low_memory: Stream the sheet straight into trimmed categorical
+                columns, map it without a defensive copy and release it
+                once mapped
+        """
         self.filepath = filepath
+        self.low_memory = low_memory
         self.dataframe: Optional[pd.DataFrame] = None
 
-    def load_excel(self, sheet_name: int = 0) -> None:
-        """Load Excel file into a pandas DataFrame."""
+    def load_excel(self, sheet_name: int = 0, engine: Optional[str] = None) -> None:
+        """
+        Load Excel file into a pandas DataFrame.
+
+        Args:
+            sheet_name: Sheet index or name
+            engine: "openpyxl" (via pandas) or "sax", which parses the sheet
+                XML directly and yields the same frame for .xlsx files.
+                Defaults to "openpyxl", or "sax" in low-memory mode, which
+                streams the sheet XML and has no openpyxl variant.
+        """
+        if engine is None:
+            engine = "sax" if self.low_memory else "openpyxl"
+        if engine not in ("openpyxl", "sax"):
+            raise ValueError(f"Unknown Excel reader engine: {engine}")
+        if self.low_memory and engine != "sax":
+            raise ValueError(f"Low-memory mode reads with the sax engine, not {engine}")
+
         try:
-            self.dataframe = pd.read_excel(
-                self.filepath, sheet_name=sheet_name, engine="openpyxl"
-            )
+            if self.low_memory:
+                # Trailing empty rows and columns are never stored, and each
+                # column keeps one code per row instead of an object pointer
+                from xlsx_reader import read_sheet_categorical
+
+                self.dataframe = read_sheet_categorical(self.filepath, sheet_name=sheet_name)
+            elif engine == "sax":
+                from xlsx_reader import read_sheet
+
+                self.dataframe = read_sheet(self.filepath, sheet_name=sheet_name)
+            else:
+                self.dataframe = pd.read_excel(
+                    self.filepath, sheet_name=sheet_name, engine="openpyxl"
+                )
             logger.info(f"Successfully loaded Excel file: {self.filepath}")
             logger.info(f"Data shape: {self.dataframe.shape}")
         except FileNotFoundError:
@@ -32,12 +70,19 @@ class ExcelMapper:
         except Exception as e:
             raise ValueError(f"Failed to load the Excel file. Error: {e}")
 
-    def map_headings(self, chapel_label: str = "CHAPEL") -> List[Dict[str, Any]]:
+    def map_headings(self, chapel_label: str = "CHAPEL",
+                     workers: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Map Excel timetable data to structured format.
+
+        The sheet is cut into sections, each made of a day-date row, its time
+        row and the data rows below it up to the next day-date row. Sections
+        are independent, so they can be mapped in a process pool; results are
+        merged in sheet order, giving the same output for any worker count.
         
         Args:
             chapel_label: Label to identify and skip chapel entries
+            workers: Number of worker processes (None or 1 maps in-process)
             
         Returns:
             List of dictionaries containing timetable entries
@@ -45,16 +90,11 @@ class ExcelMapper:
         if self.dataframe is None:
             raise ValueError("Load an Excel file before mapping headings.")
 
-        df = self.dataframe.copy()
-        output = []
-
-        # Room column: Always assumed to be the first column
-        room_col = 0
+        # Mapping only reads the frame, so low-memory mode skips the copy
+        df = self.dataframe if self.low_memory else self.dataframe.copy()
 
         # Detect all day-date rows
-        day_date_rows = self._find_rows_by_pattern(
-            df, r"^[A-Za-z]+\s+\d{2}/\d{2}/\d{2,4}$"
-        )
+        day_date_rows = self._find_rows_by_pattern(df, DAY_DATE_PATTERN)
         if not day_date_rows:
             logger.warning("No day-date rows detected in the Excel file.")
             raise ValueError("No day-date rows detected in the Excel file.")
@@ -69,13 +109,77 @@ class ExcelMapper:
 
         logger.info(f"Time rows at indices: {time_rows}")
 
+        sections = self._split_sections(df, day_date_rows)
+        logger.info(f"Split sheet into {len(sections)} day-date sections")
+
+        if workers is None or workers <= 1 or len(sections) <= 1:
+            results = [self._map_section(section, chapel_label) for section in sections]
+        else:
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=min(workers, len(sections))) as executor:
+                results = list(executor.map(
+                    _map_section_worker, sections, [chapel_label] * len(sections)
+                ))
+
+        output = []
+        rooms_processed = 0
+        for section_output, section_rooms in results:
+            output.extend(section_output)
+            rooms_processed += section_rooms
+
+        logger.info(f"Processed {rooms_processed} rooms, generated {len(output)} timetable entries")
+
+        if self.low_memory:
+            # The entries hold everything needed from here on
+            del df, sections
+            self.dataframe = None
+        return output
+
+    @staticmethod
+    def _split_sections(df: pd.DataFrame, day_date_rows: List[int]) -> List[pd.DataFrame]:
+        """
+        Cut the sheet into day-date sections.
+
+        Each section starts at a day-date row and runs up to the next one, so
+        unit codes are only ever mapped to the day-dates directly above them.
+        Rows above the first day-date row have no day-date and are dropped.
+        """
+        bounds = day_date_rows + [len(df)]
+        return [df.iloc[bounds[i]:bounds[i + 1]] for i in range(len(day_date_rows))]
+
+    def _map_section(self, df: pd.DataFrame,
+                     chapel_label: str) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Map one day-date section whose first row holds the day-dates.
+
+        Returns:
+            Tuple of (timetable entries, number of rooms processed)
+        """
+        output = []
+
+        # Room column: Always assumed to be the first column
+        room_col = 0
+
+        # The day-date row is the first row of the section, times directly below
+        day_date_rows = [0]
+        time_rows = [1] if len(df) > 1 else []
+
         # Map each day-date to its column range
         day_date_map = self._map_day_date_columns(df, day_date_rows)
-        logger.info(f"Day-date column mapping: {day_date_map}")
+        logger.debug(f"Day-date column mapping: {day_date_map}")
 
         # Identify data rows (exclude day-date rows, time rows, header rows, and empty rows)
         data_rows = self._identify_data_rows(df, day_date_rows, time_rows)
-        logger.info(f"Data rows identified at indices: {data_rows}")
+        logger.debug(f"Data rows identified at section indices: {data_rows}")
+
+        # Get times for each day-date range once per section
+        region_times = {
+            (start_col, end_col): self._extract_times_for_columns(
+                df, time_rows, list(range(start_col, end_col + 1))
+            )
+            for start_col, end_col in day_date_map
+        }
 
         # Process each data row and generate timetable entries
         rooms_processed = 0
@@ -90,9 +194,7 @@ class ExcelMapper:
             # Traverse day-date regions and extract data
             for (start_col, end_col), (day, date) in day_date_map.items():
                 valid_columns = list(range(start_col, end_col + 1))
-
-                # Get times for this day-date range
-                times = self._extract_times_for_columns(df, time_rows, valid_columns)
+                times = region_times[(start_col, end_col)]
 
                 # Process unit codes in the timetable
                 for col_idx, col in enumerate(valid_columns):
@@ -113,8 +215,7 @@ class ExcelMapper:
                         output.append(entry)
                         logger.debug(f"Added entry: {entry}")
 
-        logger.info(f"Processed {rooms_processed} rooms, generated {len(output)} timetable entries")
-        return output
+        return output, rooms_processed
 
     def _identify_data_rows(self, df: pd.DataFrame, day_date_rows: List[int], 
                            time_rows: List[int]) -> List[int]:
@@ -222,7 +323,7 @@ class ExcelMapper:
 
             for col in range(len(df.columns)):
                 cell = df.iloc[row, col]
-                if isinstance(cell, str) and re.match(r"^[A-Za-z]+\s+\d{2}/\d{2}/\d{2,4}$", cell.strip()):
+                if isinstance(cell, str) and re.match(DAY_DATE_PATTERN, cell.strip()):
                     # Save previous mapping if it exists
                     if current_day_date is not None and current_start_col is not None:
                         day_date_map[(current_start_col, col - 1)] = current_day_date
@@ -280,6 +381,37 @@ class ExcelMapper:
         except Exception as e:
             raise ValueError(f"Failed to export data to JSON. Error: {e}")
 
+    def export_to_columnar(self, data: List[Dict[str, Any]], output_path: str,
+                           file_format: Optional[str] = None) -> None:
+        """
+        Export timetable data to a Parquet or Feather file.
+
+        String columns are dictionary-encoded; read them back selectively with
+        columnar_store.load_entries. Requires pyarrow.
+        """
+        from columnar_store import write_entries
+
+        try:
+            write_entries(data, output_path, file_format=file_format)
+        except ImportError:
+            raise
+        except Exception as e:
+            raise ValueError(f"Failed to export data to columnar format. Error: {e}")
+
+    def export_to_snapshot(self, data: List[Dict[str, Any]], output_path: str) -> None:
+        """
+        Export timetable data to a memory-mapped snapshot (*.wsnap).
+
+        Open it with snapshot.Snapshot to query by unit code or date without
+        loading every entry.
+        """
+        from snapshot import write_snapshot
+
+        try:
+            write_snapshot(data, output_path)
+        except Exception as e:
+            raise ValueError(f"Failed to export data to snapshot. Error: {e}")
+
     def get_summary_stats(self) -> Dict[str, Any]:
         """Get summary statistics about the loaded data."""
         if self.dataframe is None:
@@ -290,17 +422,26 @@ class ExcelMapper:
             "columns": len(self.dataframe.columns),
             "shape": self.dataframe.shape,
             "column_names": list(self.dataframe.columns),
-            "memory_usage": self.dataframe.memory_usage(deep=True).sum()
+            # Deep inspection walks every object cell; categoricals don't need it
+            "memory_usage": self.dataframe.memory_usage(deep=not self.low_memory).sum()
         }
 
 
+def _map_section_worker(section: pd.DataFrame,
+                        chapel_label: str) -> Tuple[List[Dict[str, Any]], int]:
+    """Map a single day-date section in a worker process."""
+    return ExcelMapper("")._map_section(section, chapel_label)
+
+
 # Enhanced main script with better error handling
 def main():
     """Main execution function with comprehensive error handling."""
     import sys
     
-    # Allow command-line argument for custom filepath
-    filepath = sys.argv[1] if len(sys.argv) > 1 else "exam2.xlsx"
+    # Allow command-line argument for custom filepath; --no-gui skips the GUI
+    args = [arg for arg in sys.argv[1:] if arg != "--no-gui"]
+    show_gui = "--no-gui" not in sys.argv[1:]
+    filepath = args[0] if args else "exam2.xlsx"
     output_file = "output.json"
 
     try:
@@ -324,6 +465,9 @@ def main():
         print(f"✓ Successfully processed {len(cleaned_data)} timetable entries")
         print(f"✓ Data exported to {output_file}")
         
+        if not show_gui:
+            return
+
         # Start GUI if timetable_gui module is available
         try:
             import tkinter as tk
@@ -0,0 +1,127 @@
+from typing import Iterable, List, Dict, Tuple, Optional, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance between two strings."""
+    if a == b:
+        return 0
+
+    # Unit codes share long prefixes (faculty) and suffixes (variant letter)
+    start = 0
+    end_a, end_b = len(a), len(b)
+    while start < end_a and start < end_b and a[start] == b[start]:
+        start += 1
+    while end_a > start and end_b > start and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    a, b = a[start:end_a], b[start:end_b]
+
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a)
+
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        left = i
+        for j, cb in enumerate(b):
+            # Substitution, then deletion and insertion
+            cost = previous[j] if ca == cb else previous[j] + 1
+            if previous[j + 1] + 1 < cost:
+                cost = previous[j + 1] + 1
+            if left + 1 < cost:
+                cost = left + 1
+            current.append(cost)
+            left = cost
+        previous = current
+    return previous[-1]
+
+
+class FuzzyUnitIndex:
+    """
+    "Did you mean" lookup over unit codes, backed by a BK-tree.
+
+    A BK-tree stores each code under its parent at their edit distance. By the
+    triangle inequality, a query within distance d of a match only needs to
+    visit children whose edge label is within d of the parent's distance,
+    so most of the catalogue is never compared.
+    """
+
+    def __init__(self, unit_codes: Iterable[str]):
+        # Node: [normalized code, {distance: child node}]
+        self.root: Optional[List[Any]] = None
+        self.codes: Dict[str, str] = {}
+
+        for code in unit_codes:
+            key = self._normalize(code)
+            if not key or key in self.codes:
+                continue
+            self.codes[key] = code
+            self._insert(key)
+
+        logger.debug(f"Fuzzy unit index built over {len(self.codes)} codes")
+
+    @classmethod
+    def from_entries(cls, timetable_data: List[Dict[str, Any]]) -> "FuzzyUnitIndex":
+        """Build an index over the unit codes of mapped timetable entries."""
+        return cls(item["unit_code"] for item in timetable_data)
+
+    @staticmethod
+    def _normalize(code: str) -> str:
+        """Match codes case-insensitively and ignore spaces, as the mapper does."""
+        return code.replace(" ", "").upper()
+
+    def _insert(self, key: str) -> None:
+        """Insert a normalized code into the tree."""
+        if self.root is None:
+            self.root = [key, {}]
+            return
+
+        node = self.root
+        while True:
+            distance = edit_distance(key, node[0])
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = [key, {}]
+                return
+            node = child
+
+    def __contains__(self, code: str) -> bool:
+        return self._normalize(code) in self.codes
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def search(self, query: str, max_distance: int = 2) -> List[Tuple[str, int]]:
+        """
+        Find unit codes within `max_distance` edits of the query.
+
+        Returns:
+            List of (unit code, distance), closest first
+        """
+        key = self._normalize(query)
+        if self.root is None or not key:
+            return []
+
+        matches = []
+        stack = [self.root]
+        while stack:
+            node_key, children = stack.pop()
+            distance = edit_distance(key, node_key)
+            if distance <= max_distance:
+                matches.append((self.codes[node_key], distance))
+            for edge in range(distance - max_distance, distance + max_distance + 1):
+                child = children.get(edge)
+                if child is not None:
+                    stack.append(child)
+
+        matches.sort(key=lambda match: (match[1], match[0]))
+        return matches
+
+    def suggest(self, query: str, limit: int = 5, max_distance: int = 2) -> List[str]:
+        """Closest unit codes to a query that is not an exact match."""
+        return [code for code, _ in self.search(query, max_distance)[:limit]]
@@ -0,0 +1,129 @@
+import json
+import time
+from bisect import bisect_left
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from functools import wraps
+from typing import Callable, Deque, Dict, Iterator, List, Optional, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is open-ended
+BUCKET_BOUNDS_MS = [0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500]
+
+
+class LatencyTracer:
+    """
+    Record per-handler latencies as histograms plus a rolling window of samples.
+
+    The histogram covers every call since the tracer was created, while the
+    rolling window drives the short summary shown in the GUI status bar.
+    """
+
+    def __init__(self, window: int = 200):
+        self.window = window
+        self.histograms: Dict[str, List[int]] = defaultdict(
+            lambda: [0] * (len(BUCKET_BOUNDS_MS) + 1)
+        )
+        self.recent: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=self.window))
+        self.totals: Dict[str, float] = defaultdict(float)
+        self.counts: Dict[str, int] = defaultdict(int)
+        # Seconds spent inside paused() blocks, subtracted from running calls
+        self.paused_total = 0.0
+        self._pause_depth = 0
+
+    def record(self, name: str, elapsed_ms: float) -> None:
+        """Record one call of a handler that took `elapsed_ms` milliseconds."""
+        self.histograms[name][bisect_left(BUCKET_BOUNDS_MS, elapsed_ms)] += 1
+        self.recent[name].append(elapsed_ms)
+        self.totals[name] += elapsed_ms
+        self.counts[name] += 1
+
+    def wrap(self, name: str, handler: Callable,
+             on_record: Optional[Callable[[str], None]] = None) -> Callable:
+        """
+        Return `handler` wrapped so every call is timed under `name`.
+
+        Args:
+            name: Histogram name, usually the handler's method name
+            handler: Callable to time
+            on_record: Optional callback invoked with `name` after each call
+        """
+        @wraps(handler)
+        def traced(*args, **kwargs):
+            start = time.perf_counter()
+            paused_at_start = self.paused_total
+            try:
+                return handler(*args, **kwargs)
+            finally:
+                paused = self.paused_total - paused_at_start
+                self.record(name, (time.perf_counter() - start - paused) * 1000)
+                if on_record is not None:
+                    on_record(name)
+
+        return traced
+
+    @contextmanager
+    def paused(self) -> Iterator[None]:
+        """
+        Leave the enclosed time out of every traced call in progress.
+
+        Use it around modal dialogs, so histograms measure the handler and
+        not how long the user takes to dismiss the dialog.
+        """
+        self._pause_depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._pause_depth -= 1
+            # Nested pauses are already covered by the outermost one
+            if self._pause_depth == 0:
+                self.paused_total += time.perf_counter() - start
+
+    @staticmethod
+    def _percentile(samples: List[float], pct: float) -> float:
+        """Nearest-rank percentile of already sorted samples."""
+        if not samples:
+            return 0.0
+        rank = min(len(samples) - 1, max(0, int(round(pct / 100 * len(samples))) - 1))
+        return samples[rank]
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Get per-handler statistics, with percentiles over the rolling window."""
+        stats = {}
+        for name in sorted(self.counts):
+            samples = sorted(self.recent[name])
+            stats[name] = {
+                "count": self.counts[name],
+                "mean_ms": self.totals[name] / self.counts[name],
+                "p50_ms": self._percentile(samples, 50),
+                "p95_ms": self._percentile(samples, 95),
+                "max_ms": samples[-1] if samples else 0.0,
+                "histogram": dict(zip(
+                    [f"<={b}ms" for b in BUCKET_BOUNDS_MS] + [f">{BUCKET_BOUNDS_MS[-1]}ms"],
+                    self.histograms[name],
+                )),
+            }
+        return stats
+
+    def format_summary(self, name: str) -> str:
+        """One-line rolling summary for a handler, suitable for a status bar."""
+        samples = sorted(self.recent.get(name, ()))
+        if not samples:
+            return f"{name}: no calls"
+        return (
+            f"{name}: {self.recent[name][-1]:.1f} ms "
+            f"(p50 {self._percentile(samples, 50):.1f}, "
+            f"p95 {self._percentile(samples, 95):.1f}, n={self.counts[name]})"
+        )
+
+    def dump(self, output_path: str) -> None:
+        """Write the summary and histograms to a JSON file."""
+        try:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(self.summary(), f, indent=4)
+            logger.info(f"Latency trace written to {output_path}")
+        except Exception as e:
+            raise ValueError(f"Failed to write latency trace. Error: {e}")
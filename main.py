@@ -1,11 +1,17 @@
-import tkinter as tk
-from tkinter import messagebox, filedialog
 from excel_mapper import ExcelMapper
-from timetable_gui import TimetableGUI
 import sys
 import os
 
 if __name__ == "__main__":
+    # Headless batch mode: hand over before tkinter is ever imported
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        from batch_cli import main as batch_main
+        sys.exit(batch_main(sys.argv[2:]))
+
+    import tkinter as tk
+    from tkinter import messagebox, filedialog
+    from timetable_gui import TimetableGUI
+
     # Determine filepath: command-line arg, file dialog, or default
     if len(sys.argv) > 1 and sys.argv[1] not in ["--select", "-s"]:
         # Use command-line argument as filepath
@@ -0,0 +1,185 @@
+"""
+Printable per-room and per-date exam schedules as one multi-sheet workbook.
+
+Entries are sorted once by (group, date, time, ...) and scanned with
+groupby, so each sheet is written in a single pass. The workbook uses
+openpyxl's write-only mode: every sheet streams its rows to disk as it is
+written, so rows are never held in memory. openpyxl still keeps each
+sheet's settings and file reference until the workbook is saved, about
+18 KB per sheet, so memory grows slowly with the number of sheets.
+"""
+import argparse
+import re
+import sys
+from itertools import groupby
+from typing import Callable, Iterable, List, Dict, Tuple, Optional, Any
+import logging
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Alignment, Border, Font, NamedStyle, PatternFill, Side
+from openpyxl.utils import get_column_letter
+
+from time_slots import parse_time_range
+
+logger = logging.getLogger(__name__)
+
+# Excel limits sheet titles to 31 characters and forbids these characters
+MAX_TITLE_LENGTH = 31
+INVALID_TITLE_CHARS = re.compile(r"[\[\]:*?/\\]")
+
+TITLE_FONT = Font(bold=True, size=14)
+HEADER_FONT = Font(bold=True, color="FFFFFF")
+HEADER_FILL = PatternFill("solid", fgColor="34495E")
+CELL_BORDER = Border(bottom=Side(style="thin", color="BDC3C7"))
+TITLE_STYLE = "Schedule Title"
+HEADER_STYLE = "Schedule Header"
+BODY_STYLE = "Schedule Body"
+COLUMN_WIDTHS = {"Date": 12, "Day": 12, "Time": 18, "Room": 14, "Unit Code": 14}
+
+
+def _date_key(date: str) -> Tuple:
+    """Sort "DD/MM/YY" dates chronologically; anything else sorts after, as text."""
+    parts = date.split("/")
+    if len(parts) == 3 and all(part.isdigit() for part in parts):
+        day, month, year = (int(part) for part in parts)
+        return (0, year, month, day)
+    return (1, date)
+
+
+def _time_key(time_value: str) -> Tuple:
+    """Sort time ranges by start time; unparsable ranges sort after, as text."""
+    parsed = parse_time_range(time_value)
+    return (0, parsed[0], "") if parsed else (1, 0, time_value)
+
+
+# Report kind: (group field, title prefix, sheet columns, sort key within a group)
+REPORT_LAYOUTS: Dict[str, Tuple[str, str, List[str], Callable[[Dict[str, Any]], Tuple]]] = {
+    "room": (
+        "room", "Room", ["Date", "Day", "Time", "Unit Code"],
+        lambda item: (_date_key(item["date"]), _time_key(item["time"]), item["unit_code"]),
+    ),
+    "date": (
+        "date", "Exams on", ["Time", "Room", "Unit Code"],
+        lambda item: (_time_key(item["time"]), item["room"], item["unit_code"]),
+    ),
+}
+
+FIELD_FOR_COLUMN = {"Date": "date", "Day": "day", "Time": "time", "Room": "room", "Unit Code": "unit_code"}
+
+
+def sheet_title(name: str, used: set) -> str:
+    """Make a valid, unique sheet title from a room name or date."""
+    base = INVALID_TITLE_CHARS.sub("-", str(name)).strip("'") or "Sheet"
+    title = base[:MAX_TITLE_LENGTH]
+    n = 2
+    while title.lower() in used:
+        suffix = f" ({n})"
+        title = base[:MAX_TITLE_LENGTH - len(suffix)] + suffix
+        n += 1
+    used.add(title.lower())
+    return title
+
+
+def _register_styles(wb: Workbook) -> None:
+    """
+    Add the title, header and body styles to a workbook as named styles.
+
+    Assigning fonts and fills cell by cell hashes every style object against
+    the workbook's style tables; a registered named style is looked up by
+    name instead, which is most of the per-row cost.
+    """
+    alignment = Alignment(vertical="center")
+    wb.add_named_style(NamedStyle(TITLE_STYLE, font=TITLE_FONT, alignment=alignment))
+    wb.add_named_style(NamedStyle(HEADER_STYLE, font=HEADER_FONT, fill=HEADER_FILL, alignment=alignment))
+    wb.add_named_style(NamedStyle(BODY_STYLE, border=CELL_BORDER, alignment=alignment))
+
+
+def _styled_cell(ws, value: Any, style: str) -> WriteOnlyCell:
+    """A cell holding `value` in one of the registered named styles."""
+    cell = WriteOnlyCell(ws, value=value)
+    cell.style = style
+    return cell
+
+
+def write_report(entries: Iterable[Dict[str, Any]], output_path: str, group_by: str = "room") -> int:
+    """
+    Write one formatted sheet per room or per date.
+
+    Args:
+        entries: Mapped timetable entries
+        output_path: Destination .xlsx file
+        group_by: "room" for door schedules or "date" for daily schedules
+
+    Returns:
+        Number of sheets written
+    """
+    if group_by not in REPORT_LAYOUTS:
+        raise ValueError(f"Unknown report grouping '{group_by}', expected one of: {', '.join(REPORT_LAYOUTS)}")
+    field, prefix, columns, row_key = REPORT_LAYOUTS[group_by]
+    group_key = _date_key if field == "date" else str
+
+    # One sort puts every group's rows together and in print order
+    ordered = sorted(entries, key=lambda item: (group_key(item[field]), item[field], row_key(item)))
+
+    try:
+        wb = Workbook(write_only=True)
+        _register_styles(wb)
+        used_titles: set = set()
+        sheets = 0
+        for name, rows in groupby(ordered, key=lambda item: item[field]):
+            ws = wb.create_sheet(sheet_title(name, used_titles))
+            # Layout must be set before the first row is streamed
+            for index, column in enumerate(columns, 1):
+                ws.column_dimensions[get_column_letter(index)].width = COLUMN_WIDTHS[column]
+            ws.freeze_panes = "A3"
+            ws.print_title_rows = "1:2"
+            # Print one page wide, as many pages tall as needed
+            ws.sheet_properties.pageSetUpPr.fitToPage = True
+            ws.page_setup.fitToHeight = 0
+
+            fields = [FIELD_FOR_COLUMN[column] for column in columns]
+
+            ws.append([_styled_cell(ws, f"{prefix} {name}", TITLE_STYLE)])
+            ws.append([_styled_cell(ws, column, HEADER_STYLE) for column in columns])
+            for item in rows:
+                ws.append([_styled_cell(ws, item[f], BODY_STYLE) for f in fields])
+            # Finish the sheet now so its stream is flushed and closed
+            # instead of staying open until the workbook is saved
+            ws.close()
+            sheets += 1
+
+        if sheets == 0:
+            # A workbook needs at least one sheet to be valid
+            wb.create_sheet("Empty").append(["No timetable entries"])
+        wb.save(output_path)
+        logger.info(f"Wrote {sheets} {group_by} schedules to {output_path}")
+        return sheets
+    except Exception as e:
+        raise ValueError(f"Failed to write the {group_by} report. Error: {e}")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Write per-room or per-date schedules for a mapped timetable."""
+    from timetable_diff import iter_entries
+
+    parser = argparse.ArgumentParser(description="Write printable per-room or per-date exam schedules.")
+    parser.add_argument("timetable", help="Workbook or mapped export (JSON, Parquet, Feather, snapshot)")
+    parser.add_argument("-b", "--by", choices=list(REPORT_LAYOUTS), default="room",
+                        help="One sheet per room or per exam date (default: room)")
+    parser.add_argument("-o", "--output", help="Destination workbook (default: <by>_schedules.xlsx)")
+    args = parser.parse_args(argv)
+
+    output_path = args.output or f"{args.by}_schedules.xlsx"
+    try:
+        sheets = write_report(iter_entries(args.timetable), output_path, group_by=args.by)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"✓ {sheets} {args.by} schedules written to {output_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
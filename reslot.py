@@ -0,0 +1,180 @@
+from typing import List, Dict, Tuple, Optional, Any
+from collections import defaultdict
+import logging
+
+from time_slots import SlotIndex, iter_bits
+
+logger = logging.getLogger(__name__)
+
+
+class ReslotSolver:
+    """
+    Suggest alternative placements for units that clash within a cohort.
+
+    Occupancy is held as Python integers used as bitsets: one bitset per room
+    over all (date, time) slots, and one bitset per slot over all rooms. Finding
+    a free placement is then a handful of AND/OR operations per candidate slot.
+    Slots clash when they are on the same date and their time ranges overlap,
+    whatever their labels.
+    """
+
+    def __init__(self, timetable_data: List[Dict[str, Any]]):
+        # Slots are kept in first-seen order, which follows the sheet layout
+        self.slot_table = SlotIndex()
+        self.slots: List[Tuple[str, str, str]] = self.slot_table.slots
+        self.slot_index: Dict[Tuple[str, str], int] = self.slot_table.index
+        self.rooms: List[str] = []
+        self.room_index: Dict[str, int] = {}
+
+        self.room_occupancy: Dict[str, int] = defaultdict(int)
+        self.slot_room_occupancy: Dict[int, int] = defaultdict(int)
+        self.unit_slots: Dict[str, int] = defaultdict(int)
+        self.unit_rooms: Dict[Tuple[str, int], List[str]] = defaultdict(list)
+        self.date_masks: Dict[str, int] = defaultdict(int)
+
+        for item in timetable_data:
+            slot = self.slot_table.add(item)
+            room = item["room"]
+            if room not in self.room_index:
+                self.room_index[room] = len(self.rooms)
+                self.rooms.append(room)
+
+            unit_code = item["unit_code"].upper()
+            self.room_occupancy[room] |= 1 << slot
+            self.slot_room_occupancy[slot] |= 1 << self.room_index[room]
+            self.unit_slots[unit_code] |= 1 << slot
+            self.unit_rooms[(unit_code, slot)].append(room)
+
+        for slot, (date, _, _) in enumerate(self.slots):
+            self.date_masks[date] |= 1 << slot
+        self.overlap_masks = self.slot_table.overlap_masks()
+
+        self.all_slots = (1 << len(self.slots)) - 1
+        self.all_rooms = (1 << len(self.rooms)) - 1
+        logger.debug(
+            f"Reslot solver built over {len(self.slots)} slots and {len(self.rooms)} rooms"
+        )
+
+    def _blocked(self, mask: int) -> int:
+        """Every slot overlapping a slot in `mask`."""
+        blocked = 0
+        for slot in iter_bits(mask):
+            blocked |= self.overlap_masks[slot]
+        return blocked
+
+    def find_clashes(self, unit_codes: List[str]) -> Dict[int, List[str]]:
+        """
+        Find slots where one of the given units overlaps another of them.
+
+        Args:
+            unit_codes: Units taken together by a cohort
+
+        Returns:
+            Mapping of slot index to the units sitting at that slot that
+            overlap another unit, in slot order
+        """
+        units = [code.upper() for code in unit_codes]
+        blocked = {unit: self._blocked(self.unit_slots.get(unit, 0)) for unit in units}
+
+        clashing: Dict[int, List[str]] = defaultdict(list)
+        for unit in units:
+            others = 0
+            for other in units:
+                if other != unit:
+                    others |= blocked[other]
+            for slot in iter_bits(self.unit_slots.get(unit, 0) & others):
+                clashing[slot].append(unit)
+        return {slot: clashing[slot] for slot in sorted(clashing)}
+
+    def _free_rooms(self, slot: int, count: int) -> Optional[List[str]]:
+        """Pick `count` rooms that are free at the given slot, or None."""
+        free = ~self.slot_room_occupancy.get(slot, 0) & self.all_rooms
+        picked = []
+        for room_idx in iter_bits(free):
+            picked.append(self.rooms[room_idx])
+            if len(picked) == count:
+                return picked
+        return None
+
+    def suggest_moves(self, unit_codes: List[str], max_suggestions: int = 5) -> List[Dict[str, Any]]:
+        """
+        Suggest alternative (date, time, room) placements for clashing units.
+
+        A candidate slot must not overlap any other unit in the cohort, nor
+        the best suggestion already made for another clashing unit, so taking
+        every unit's first suggestion never creates a new clash. Keeping the
+        unit's current rooms is preferred; otherwise the same number of rooms
+        free at that slot is offered instead.
+
+        Args:
+            unit_codes: Units taken together by a cohort
+            max_suggestions: Maximum number of suggestions per clashing unit
+
+        Returns:
+            List of suggestion dictionaries, best first for each unit
+        """
+        units = [code.upper() for code in unit_codes]
+        clashes = self.find_clashes(units)
+        suggestions = []
+        # Slots of the moves suggested first, kept clear for later units
+        taken = 0
+
+        for slot, clashing_units in clashes.items():
+            for unit in clashing_units:
+                unit_suggestions = self._suggest_for_unit(unit, slot, units, max_suggestions, taken)
+                if unit_suggestions:
+                    best = unit_suggestions[0]
+                    taken |= 1 << self.slot_index[(best["date"], best["time"])]
+                suggestions.extend(unit_suggestions)
+
+        logger.info(f"Generated {len(suggestions)} re-slotting suggestions for {len(clashes)} clashes")
+        return suggestions
+
+    def _suggest_for_unit(self, unit: str, slot: int, units: List[str],
+                          max_suggestions: int, taken: int = 0) -> List[Dict[str, Any]]:
+        """Rank candidate placements for moving one unit out of one slot."""
+        others_mask = taken
+        for other in units:
+            if other != unit:
+                others_mask |= self.unit_slots.get(other, 0)
+
+        # Never move onto a slot overlapping the cohort or the unit itself
+        blocked = self._blocked(others_mask | self.unit_slots.get(unit, 0))
+        candidates = self.all_slots & ~blocked
+
+        rooms = self.unit_rooms.get((unit, slot), [])
+        rooms_busy = 0
+        for room in rooms:
+            rooms_busy |= self.room_occupancy.get(room, 0)
+
+        date, day, time = self.slots[slot]
+        ranked = []
+        for candidate in iter_bits(candidates):
+            new_date, new_day, new_time = self.slots[candidate]
+            if not rooms_busy >> candidate & 1:
+                new_rooms = list(rooms)
+                rooms_changed = 0
+            else:
+                new_rooms = self._free_rooms(candidate, len(rooms))
+                if new_rooms is None:
+                    continue
+                rooms_changed = len(rooms)
+
+            # Exams the cohort would already sit on the new date
+            same_day = bin(self.date_masks[new_date] & others_mask).count("1")
+            score = same_day * 3 + rooms_changed * 2 + (1 if new_date != date else 0)
+            ranked.append((score, candidate, new_rooms))
+
+        ranked.sort(key=lambda x: (x[0], x[1]))
+        return [
+            {
+                "unit_code": unit,
+                "from": {"day": day, "date": date, "time": time, "rooms": rooms},
+                "day": self.slots[candidate][1],
+                "date": self.slots[candidate][0],
+                "time": self.slots[candidate][2],
+                "rooms": new_rooms,
+                "score": score,
+            }
+            for score, candidate, new_rooms in ranked[:max_suggestions]
+        ]
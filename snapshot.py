@@ -0,0 +1,247 @@
+"""
+Memory-mapped, read-only snapshots of mapped timetable entries.
+
+A snapshot is a single little-endian file:
+
+    header     magic, version, record/string/unit/date counts, section offsets
+    strings    sorted string table: (count + 1) u32 offsets, then UTF-8 bytes
+    records    fixed-width rows of 5 u32 string ids (room, day, date, time, unit_code),
+               sorted by normalized unit code
+    unit index (key id, first record, record count) per normalized unit code
+    date index (date id, first slot, slot count) per date, followed by a
+               permutation of record numbers ordered by date
+
+Opening a snapshot maps the file and reads only the header. Every query
+binary-searches the sorted tables in place, so processes opening the same
+file share its pages through the OS cache and nothing is deserialized
+until an entry is returned.
+"""
+import mmap
+import struct
+import sys
+from bisect import bisect_left
+from typing import Iterator, List, Dict, Optional, Any
+import logging
+
+from time_slots import normalize_unit_code
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"WSNP"
+# Version 2 indexes unit codes without spaces, as the rest of the application matches them
+VERSION = 2
+SNAPSHOT_EXTENSION = ".wsnap"
+FIELDS = ["room", "day", "date", "time", "unit_code"]
+
+# magic, version, records, strings, units, dates, then five section offsets
+HEADER = struct.Struct("<4sHIIII5Q")
+
+
+def write_snapshot(data: List[Dict[str, Any]], output_path: str) -> None:
+    """
+    Write mapped entries to a snapshot file.
+
+    Args:
+        data: Mapped timetable entries
+        output_path: Destination file (conventionally *.wsnap)
+    """
+    strings = sorted(
+        {str(item[field]) for item in data for field in FIELDS}
+        | {normalize_unit_code(str(item["unit_code"])) for item in data}
+    )
+    string_ids = {s: i for i, s in enumerate(strings)}
+
+    # Records sorted by normalized unit code make each unit a contiguous run
+    rows = sorted(
+        (normalize_unit_code(str(item["unit_code"])), [string_ids[str(item[field])] for field in FIELDS])
+        for item in data
+    )
+    records = [ids for _, ids in rows]
+
+    unit_index = []
+    for number, (key, _) in enumerate(rows):
+        if unit_index and unit_index[-1][0] == string_ids[key]:
+            unit_index[-1][2] += 1
+        else:
+            unit_index.append([string_ids[key], number, 1])
+
+    date_field = FIELDS.index("date")
+    by_date = sorted(range(len(records)), key=lambda n: (records[n][date_field], n))
+    date_index = []
+    for slot, number in enumerate(by_date):
+        date_id = records[number][date_field]
+        if date_index and date_index[-1][0] == date_id:
+            date_index[-1][2] += 1
+        else:
+            date_index.append([date_id, slot, 1])
+
+    encoded = [s.encode("utf-8") for s in strings]
+    string_offsets = [0]
+    for blob in encoded:
+        string_offsets.append(string_offsets[-1] + len(blob))
+    string_data = b"".join(encoded)
+
+    def pack_u32(values: List[int]) -> bytes:
+        return struct.pack(f"<{len(values)}I", *values)
+
+    def align(size: int) -> int:
+        return (size + 7) & ~7
+
+    sections = [
+        pack_u32(string_offsets),
+        string_data,
+        pack_u32([i for ids in records for i in ids]),
+        pack_u32([v for entry in unit_index for v in entry]),
+        pack_u32([v for entry in date_index for v in entry] + by_date),
+    ]
+    offsets = []
+    position = HEADER.size
+    for section in sections:
+        position = align(position)
+        offsets.append(position)
+        position += len(section)
+
+    try:
+        with open(output_path, "wb") as f:
+            f.write(HEADER.pack(
+                MAGIC, VERSION, len(records), len(strings), len(unit_index), len(date_index), *offsets
+            ))
+            for offset, section in zip(offsets, sections):
+                f.write(b"\0" * (offset - f.tell()))
+                f.write(section)
+        logger.info(f"Wrote snapshot of {len(records)} entries to {output_path}")
+    except Exception as e:
+        raise ValueError(f"Failed to write snapshot. Error: {e}")
+
+
+class Snapshot:
+    """
+    Read-only view of a snapshot file through mmap.
+
+    Supports len(), indexing, iteration and indexed lookups by unit code and
+    date, each returning entries as dictionaries like the mapper produces.
+    """
+
+    def __init__(self, path: str):
+        if sys.byteorder != "little":
+            raise ValueError("Snapshots can only be read on little-endian machines")
+
+        self.path = path
+        try:
+            self._file = open(path, "rb")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Snapshot file not found: {path}")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            (magic, version, self._n_records, n_strings, n_units, n_dates,
+             strings_at, data_at, records_at, units_at, dates_at) = HEADER.unpack_from(self._mmap)
+        except struct.error:
+            self.close()
+            raise ValueError(f"Not a timetable snapshot: {path}")
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise ValueError(f"Not a timetable snapshot (or unsupported version): {path}")
+
+        self._view = view = memoryview(self._mmap)
+        self._string_offsets = view[strings_at:strings_at + 4 * (n_strings + 1)].cast("I")
+        self._string_data = view[data_at:records_at]
+        self._records = view[records_at:records_at + 20 * self._n_records].cast("I")
+        self._units = view[units_at:units_at + 12 * n_units].cast("I")
+        self._dates = view[dates_at:dates_at + 12 * n_dates].cast("I")
+        self._by_date = view[dates_at + 12 * n_dates:dates_at + 12 * n_dates + 4 * self._n_records].cast("I")
+        self._n_strings = n_strings
+        self._cache: Dict[int, str] = {}
+        self.closed = False
+
+    def close(self) -> None:
+        """Release the memory map and file handle; later queries raise ValueError."""
+        self.closed = True
+        for name in ("_string_offsets", "_string_data", "_records", "_units", "_dates", "_by_date", "_view"):
+            view = self.__dict__.pop(name, None)
+            if view is not None:
+                view.release()
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> "Snapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _require_open(self) -> None:
+        if self.closed:
+            raise ValueError(f"snapshot is closed: {self.path}")
+
+    def _string(self, string_id: int) -> str:
+        """Decode one string from the table, caching repeated values."""
+        cached = self._cache.get(string_id)
+        if cached is None:
+            start, end = self._string_offsets[string_id], self._string_offsets[string_id + 1]
+            cached = str(self._string_data[start:end], "utf-8")
+            self._cache[string_id] = cached
+        return cached
+
+    def _string_id(self, value: str) -> Optional[int]:
+        """Find a string's id by binary search over the sorted table."""
+        lo, hi = 0, self._n_strings
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._string(mid) < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self._n_strings and self._string(lo) == value:
+            return lo
+        return None
+
+    def _find_run(self, index: memoryview, key: str) -> Optional[range]:
+        """Binary-search an index of (key id, start, count) triples."""
+        key_id = self._string_id(key)
+        if key_id is None:
+            return None
+        keys = index[0::3]
+        pos = bisect_left(keys, key_id)
+        if pos < len(keys) and keys[pos] == key_id:
+            start, count = index[3 * pos + 1], index[3 * pos + 2]
+            return range(start, start + count)
+        return None
+
+    def __len__(self) -> int:
+        return self._n_records
+
+    def __getitem__(self, number: int) -> Dict[str, Any]:
+        self._require_open()
+        if number < 0:
+            number += self._n_records
+        if not 0 <= number < self._n_records:
+            raise IndexError("snapshot record out of range")
+        base = 5 * number
+        return {field: self._string(self._records[base + i]) for i, field in enumerate(FIELDS)}
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for number in range(self._n_records):
+            yield self[number]
+
+    def by_unit(self, unit_code: str) -> List[Dict[str, Any]]:
+        """Entries for a unit code, matched case-insensitively and without spaces."""
+        self._require_open()
+        run = self._find_run(self._units, normalize_unit_code(unit_code))
+        return [self[number] for number in run] if run else []
+
+    def by_date(self, date: str) -> List[Dict[str, Any]]:
+        """Entries on a date, as written in the timetable (e.g. "22/04/24")."""
+        self._require_open()
+        run = self._find_run(self._dates, date)
+        return [self[self._by_date[slot]] for slot in run] if run else []
+
+    def unit_codes(self) -> List[str]:
+        """Sorted normalized unit codes, read from the unit index alone."""
+        self._require_open()
+        return [self._string(self._units[3 * i]) for i in range(len(self._units) // 3)]
+
+    def dates(self) -> List[str]:
+        """Dates present in the snapshot, read from the date index alone."""
+        self._require_open()
+        return [self._string(self._dates[3 * i]) for i in range(len(self._dates) // 3)]
@@ -0,0 +1,104 @@
+"""
+Exam slot and unit code helpers shared by the clash, re-slotting, planning,
+report and storage modules.
+
+This module only uses the standard library, so GUI-side features can use
+it without loading pandas or scipy.
+"""
+import re
+from typing import Iterable, List, Dict, Tuple, Optional, Any
+
+TIME_PATTERN = re.compile(r"^(\d{1,2})[:.](\d{2})\s*(AM|PM)?$")
+
+
+def normalize_unit_code(unit_code: str) -> str:
+    """Unit codes are matched case-insensitively and without spaces."""
+    return unit_code.replace(" ", "").upper()
+
+
+def _to_minutes(hours: int, minutes: int, suffix: Optional[str]) -> int:
+    """Minutes since midnight for a 12- or 24-hour clock time."""
+    if suffix:
+        hours = hours % 12 + (12 if suffix == "PM" else 0)
+    return hours * 60 + minutes
+
+
+def parse_time_range(time_value: str) -> Optional[Tuple[int, int]]:
+    """
+    Parse a slot such as "9:00AM-11:00AM" into minutes since midnight.
+
+    Sheets sometimes mislabel the start, as in "11:30PM-1:30PM"; a range
+    that would end before it starts is read with the other meridiem.
+
+    Returns:
+        (start, end) minutes, or None if the value is not a time range
+    """
+    parts = time_value.upper().replace(" ", "").split("-")
+    if len(parts) != 2:
+        return None
+    start_match, end_match = TIME_PATTERN.match(parts[0]), TIME_PATTERN.match(parts[1])
+    if not start_match or not end_match:
+        return None
+
+    start_h, start_m, start_suffix = start_match.groups()
+    end_h, end_m, end_suffix = end_match.groups()
+    start_suffix = start_suffix or end_suffix
+    end = _to_minutes(int(end_h), int(end_m), end_suffix)
+    start = _to_minutes(int(start_h), int(start_m), start_suffix)
+    if start >= end and start_suffix:
+        start = _to_minutes(int(start_h), int(start_m), "AM" if start_suffix == "PM" else "PM")
+    if start >= end:
+        return None
+    return start, end
+
+
+def iter_bits(mask: int) -> Iterable[int]:
+    """Yield the indices of set bits in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class SlotIndex:
+    """(date, time) exam slots numbered in first-seen order, which follows the sheet layout."""
+
+    def __init__(self):
+        self.slots: List[Tuple[str, str, str]] = []
+        self.index: Dict[Tuple[str, str], int] = {}
+
+    def __len__(self) -> int:
+        return len(self.slots)
+
+    def add(self, item: Dict[str, Any]) -> int:
+        """Return the slot number of an entry, registering new slots as needed."""
+        key = (item["date"], item["time"])
+        slot = self.index.get(key)
+        if slot is None:
+            slot = len(self.slots)
+            self.index[key] = slot
+            self.slots.append((item["date"], item["day"], item["time"]))
+        return slot
+
+    def overlap_masks(self) -> List[int]:
+        """
+        For each slot, a bitmask of the slots on the same date whose times
+        overlap it (itself included). Slots whose time cannot be parsed only
+        overlap slots with the same label.
+        """
+        ranges = [parse_time_range(time_value) for _, _, time_value in self.slots]
+        by_date: Dict[str, List[int]] = {}
+        for i, (date, _, _) in enumerate(self.slots):
+            by_date.setdefault(date, []).append(i)
+
+        masks = [0] * len(self.slots)
+        for slots in by_date.values():
+            for i in slots:
+                for j in slots:
+                    if ranges[i] is None or ranges[j] is None:
+                        overlaps = self.slots[i][2] == self.slots[j][2]
+                    else:
+                        overlaps = ranges[i][0] < ranges[j][1] and ranges[j][0] < ranges[i][1]
+                    if overlaps:
+                        masks[i] |= 1 << j
+        return masks
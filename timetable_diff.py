@@ -0,0 +1,156 @@
+"""
+Diff two versions of a mapped timetable.
+
+Entries are hash-joined on unit code, so a diff is a single pass over each
+side plus one comparison per unit. Inputs may be any iterable of entries,
+including generators, and each side can be a workbook, a JSON export or a
+Parquet/Feather export.
+"""
+import argparse
+import json
+import os
+import sys
+from collections import defaultdict
+from typing import Iterable, List, Dict, Optional, Any
+import logging
+
+logger = logging.getLogger(__name__)
+
+ADDED = "added"
+REMOVED = "removed"
+MOVED_DATE = "moved_date"
+MOVED_TIME = "moved_time"
+MOVED_ROOM = "moved_room"
+CHANGE_KINDS = [ADDED, REMOVED, MOVED_DATE, MOVED_TIME, MOVED_ROOM]
+
+
+def _group_by_unit(entries: Iterable[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Build the hash side of the join: unit code to its entries."""
+    groups = defaultdict(list)
+    for item in entries:
+        groups[item["unit_code"].upper()].append(item)
+    return groups
+
+
+def _placements(entries: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Sorted, de-duplicated placements of a unit for the report."""
+    seen = sorted({(item["date"], item["day"], item["time"], item["room"]) for item in entries})
+    return [{"date": d, "day": day, "time": t, "room": r} for d, day, t, r in seen]
+
+
+def classify(old: List[Dict[str, Any]], new: List[Dict[str, Any]]) -> List[str]:
+    """
+    Classify how one unit changed between two versions.
+
+    A changed date is reported as moved_date only, since the time usually moves
+    with it; a time change on the same dates is moved_time. Room changes are
+    reported independently.
+    """
+    if not old:
+        return [ADDED]
+    if not new:
+        return [REMOVED]
+
+    changes = []
+    old_dates = {item["date"] for item in old}
+    new_dates = {item["date"] for item in new}
+    if old_dates != new_dates:
+        changes.append(MOVED_DATE)
+    elif {(item["date"], item["time"]) for item in old} != {(item["date"], item["time"]) for item in new}:
+        changes.append(MOVED_TIME)
+
+    if {item["room"] for item in old} != {item["room"] for item in new}:
+        changes.append(MOVED_ROOM)
+    return changes
+
+
+def diff_entries(old_entries: Iterable[Dict[str, Any]],
+                 new_entries: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Diff two mapped entry sets on unit code.
+
+    Args:
+        old_entries: Entries of the earlier timetable
+        new_entries: Entries of the revised timetable
+
+    Returns:
+        Report with per-kind counts under "summary" and one record per
+        changed unit under "changes", sorted by unit code
+    """
+    old_groups = _group_by_unit(old_entries)
+    new_groups = _group_by_unit(new_entries)
+
+    changes = []
+    summary = {kind: 0 for kind in CHANGE_KINDS}
+    unchanged = 0
+    for unit_code in sorted(old_groups.keys() | new_groups.keys()):
+        old = old_groups.get(unit_code, [])
+        new = new_groups.get(unit_code, [])
+        kinds = classify(old, new)
+        if not kinds:
+            unchanged += 1
+            continue
+
+        for kind in kinds:
+            summary[kind] += 1
+        changes.append({
+            "unit_code": unit_code,
+            "changes": kinds,
+            "before": _placements(old),
+            "after": _placements(new),
+        })
+
+    summary["unchanged"] = unchanged
+    logger.info(f"Diffed {len(old_groups)} against {len(new_groups)} units: {summary}")
+    return {"summary": summary, "changes": changes}
+
+
+def iter_entries(path: str, sheet_name: int = 0) -> Iterable[Dict[str, Any]]:
+    """Yield mapped entries from a workbook, JSON export, columnar export or snapshot."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".xlsx", ".xlsm", ".xls"):
+        from excel_mapper import ExcelMapper
+
+        mapper = ExcelMapper(path)
+        mapper.load_excel(sheet_name=sheet_name)
+        yield from mapper.map_headings()
+    elif extension == ".wsnap":
+        from snapshot import Snapshot
+
+        with Snapshot(path) as snapshot:
+            yield from snapshot
+    elif extension in (".parquet", ".feather", ".arrow"):
+        from columnar_store import load_entries
+
+        yield from load_entries(path)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            yield from json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Diff two timetables and print or write the change report."""
+    parser = argparse.ArgumentParser(description="Report what moved between two timetable versions.")
+    parser.add_argument("old", help="Earlier workbook or export (e.g. exam.xlsx)")
+    parser.add_argument("new", help="Revised workbook or export (e.g. exam2.xlsx)")
+    parser.add_argument("-o", "--output", help="Write the JSON report here instead of stdout")
+    args = parser.parse_args(argv)
+
+    try:
+        report = diff_entries(iter_entries(args.old), iter_entries(args.new))
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ Error: {e}", file=sys.stderr)
+        return 1
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4, ensure_ascii=False)
+        print(f"✓ {len(report['changes'])} changed units written to {args.output}")
+    else:
+        json.dump(report, sys.stdout, indent=4, ensure_ascii=False)
+        print()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,29 @@
 import tkinter as tk
-from tkinter import messagebox, filedialog
+from tkinter import messagebox, filedialog, simpledialog
 from tkinter import ttk
 import json
 from typing import List, Dict, Any, Optional
 from collections import defaultdict
 import re
+from reslot import ReslotSolver
+from latency_tracer import LatencyTracer
+from fuzzy_index import FuzzyUnitIndex
+from elective_planner import ElectivePlanner
+
+# Event handlers timed when a LatencyTracer is attached
+TRACED_HANDLERS = [
+    "on_search_key_release",
+    "search_unit_code",
+    "add_to_basket",
+    "remove_from_basket",
+    "generate_timetable",
+    "check_conflicts",
+    "plan_electives",
+]
 
 
 class TimetableGUI:
-    def __init__(self, master, timetable_data):
+    def __init__(self, master, timetable_data, tracer: Optional[LatencyTracer] = None):
         self.master = master
         self.master.title("Timetable Generator")
         self.master.geometry("1200x800")
@@ -23,9 +38,28 @@ class TimetableGUI:
         self.selected_units = []
         self.current_search_result = None
         
-        # Get all unique unit codes for autocomplete
-        self.all_unit_codes = list(set(item["unit_code"] for item in self.timetable_data))
-        self.all_unit_codes.sort()
+        # Get all unique unit codes for autocomplete. A snapshot answers this
+        # from its unit index; a list of entries is grouped once by unit code.
+        self.unit_index = defaultdict(list)
+        if hasattr(self.timetable_data, "by_unit"):
+            self.all_unit_codes = self.timetable_data.unit_codes()
+        else:
+            for item in self.timetable_data:
+                self.unit_index[item["unit_code"].upper()].append(item)
+            self.all_unit_codes = list(set(item["unit_code"] for item in self.timetable_data))
+            self.all_unit_codes.sort()
+
+        # "Did you mean" index, built once per dataset
+        self.fuzzy_index = FuzzyUnitIndex(self.all_unit_codes)
+
+        # Occupancy bitsets for re-slotting suggestions, built on the first conflict
+        self._reslot_solver: Optional[ReslotSolver] = None
+
+        # Opt-in latency tracing; handlers are wrapped before the widgets bind them
+        self.tracer = tracer
+        if self.tracer is not None:
+            for name in TRACED_HANDLERS:
+                setattr(self, name, self.tracer.wrap(name, getattr(self, name), self.show_latency))
 
         self.setup_ui()
         self.setup_bindings()
@@ -129,6 +163,12 @@ class TimetableGUI:
         )
         self.generate_button.pack(side="left", padx=5)
 
+        self.plan_button = tk.Button(
+            button_frame, text="Plan Electives", command=self.plan_electives,
+            bg="#16a085", fg="white", font=("Arial", 12), width=15
+        )
+        self.plan_button.pack(side="left", padx=5)
+
         # Export buttons
         export_frame = tk.Frame(self.master, bg="#f0f8ff")
         export_frame.grid(row=5, column=0, columnspan=3, padx=10, pady=5)
@@ -273,17 +313,36 @@ class TimetableGUI:
         except IndexError:
             pass
 
+    def dialog(self, show, *args, **kwargs):
+        """Show a modal dialog; its time is left out of handler latencies."""
+        if self.tracer is None:
+            return show(*args, **kwargs)
+        with self.tracer.paused():
+            return show(*args, **kwargs)
+
+    def find_unit_entries(self, unit_code: str) -> List[Dict[str, Any]]:
+        """All entries for a unit code, matched case-insensitively."""
+        if hasattr(self.timetable_data, "by_unit"):
+            return self.timetable_data.by_unit(unit_code)
+        return self.unit_index.get(unit_code.upper(), [])
+
+    def reslot_solver(self) -> ReslotSolver:
+        """The re-slotting solver, built over the whole timetable on first use."""
+        if self._reslot_solver is None:
+            self._reslot_solver = ReslotSolver(self.timetable_data)
+        return self._reslot_solver
+
     def search_unit_code(self):
         """Search for a unit code in the timetable data."""
         unit_code = self.search_entry.get().strip().upper()
         if not unit_code:
-            messagebox.showerror("Input Error", "Please enter a unit code to search.")
+            self.dialog(messagebox.showerror, "Input Error", "Please enter a unit code to search.")
             return
 
         self.hide_autocomplete()
 
         # Find all instances of the unit code
-        results = [item for item in self.timetable_data if item["unit_code"].upper() == unit_code]
+        results = self.find_unit_entries(unit_code)
 
         if results:
             self.current_search_result = results[0]
@@ -293,10 +352,17 @@ class TimetableGUI:
             self.current_search_result = None
             self.result_text.config(state="normal")
             self.result_text.delete(1.0, tk.END)
-            self.result_text.insert(1.0, f"Unit Code '{unit_code}' not found.")
+            self.result_text.insert(1.0, f"Unit Code '{unit_code}' not found.{self.did_you_mean(unit_code)}")
             self.result_text.config(state="disabled")
             self.status_bar.config(text="Unit code not found")
 
+    def did_you_mean(self, unit_code):
+        """Return a "Did you mean" hint for an unknown unit code, or an empty string."""
+        suggestions = self.fuzzy_index.suggest(unit_code)
+        if not suggestions:
+            return ""
+        return f"\n\nDid you mean: {', '.join(suggestions)}?"
+
     def display_search_results(self, results):
         """Display search results in the text widget."""
         self.result_text.config(state="normal")
@@ -336,12 +402,16 @@ class TimetableGUI:
         """Add unit code to the basket."""
         unit_code = self.search_entry.get().strip().upper()
         if not unit_code:
-            messagebox.showerror("Input Error", "Please enter a unit code to add to the basket.")
+            self.dialog(messagebox.showerror, "Input Error", "Please enter a unit code to add to the basket.")
             return
 
         # Check if unit code exists
-        if not any(item["unit_code"].upper() == unit_code for item in self.timetable_data):
-            messagebox.showerror("Unit Not Found", f"Unit code '{unit_code}' not found in timetable data.")
+        if not self.find_unit_entries(unit_code):
+            self.dialog(
+                messagebox.showerror,
+                "Unit Not Found",
+                f"Unit code '{unit_code}' not found in timetable data.{self.did_you_mean(unit_code)}"
+            )
             return
 
         if unit_code not in self.selected_units:
@@ -350,14 +420,14 @@ class TimetableGUI:
             self.status_bar.config(text=f"Added {unit_code} to basket")
             self.update_statistics()
         else:
-            messagebox.showinfo("Already Added", "Unit code is already in the basket.")
+            self.dialog(messagebox.showinfo, "Already Added", "Unit code is already in the basket.")
 
     def remove_from_basket(self):
         """Remove selected unit from the basket."""
         try:
             selected_indices = self.basket_listbox.curselection()
             if not selected_indices:
-                messagebox.showerror("Selection Error", "Please select a unit to remove.")
+                self.dialog(messagebox.showerror, "Selection Error", "Please select a unit to remove.")
                 return
             
             # Remove in reverse order to maintain indices
@@ -370,12 +440,12 @@ class TimetableGUI:
             self.update_statistics()
             
         except (IndexError, ValueError):
-            messagebox.showerror("Selection Error", "Please select a unit to remove.")
+            self.dialog(messagebox.showerror, "Selection Error", "Please select a unit to remove.")
 
     def clear_basket(self):
         """Clear all items from the basket."""
         if self.selected_units:
-            result = messagebox.askyesno("Clear Basket", "Are you sure you want to clear all units from the basket?")
+            result = self.dialog(messagebox.askyesno, "Clear Basket", "Are you sure you want to clear all units from the basket?")
             if result:
                 self.selected_units.clear()
                 self.basket_listbox.delete(0, tk.END)
@@ -385,13 +455,12 @@ class TimetableGUI:
     def generate_timetable(self):
         """Generate timetable for selected units."""
         if not self.selected_units:
-            messagebox.showerror("Basket Empty", "No unit codes selected. Please add unit codes to the basket.")
+            self.dialog(messagebox.showerror, "Basket Empty", "No unit codes selected. Please add unit codes to the basket.")
             return
 
         # Filter the timetable data
         filtered_data = [
-            item for item in self.timetable_data 
-            if item["unit_code"].upper() in [unit.upper() for unit in self.selected_units]
+            item for unit in self.selected_units for item in self.find_unit_entries(unit)
         ]
 
         # Sort by day and time
@@ -432,7 +501,95 @@ class TimetableGUI:
         
         if conflicts:
             conflict_msg = "⚠️ Scheduling conflicts detected:\n\n" + "\n".join(conflicts)
-            messagebox.showwarning("Scheduling Conflicts", conflict_msg)
+
+            suggestions = self.reslot_solver().suggest_moves(self.selected_units, max_suggestions=3)
+            if suggestions:
+                conflict_msg += "\n\nSuggested moves:\n" + "\n".join(
+                    f"{s['unit_code']}: {s['day']} {s['date']} at {s['time']} "
+                    f"in Room {', '.join(s['rooms'])}"
+                    for s in suggestions
+                )
+            self.dialog(messagebox.showwarning, "Scheduling Conflicts", conflict_msg)
+
+    def plan_electives(self):
+        """Rank clash-free elective combinations that fit around the basket."""
+        pool_text = self.dialog(
+            simpledialog.askstring,
+            "Plan Electives",
+            "Elective pool (unit codes separated by commas or spaces).\n"
+            "Units in the basket are treated as required.",
+            parent=self.master
+        )
+        if not pool_text:
+            return
+        pool = [code.upper() for code in re.split(r"[,\s]+", pool_text.strip()) if code]
+        count = self.dialog(
+            simpledialog.askinteger,
+            "Plan Electives", "How many electives to choose?",
+            parent=self.master, minvalue=1, maxvalue=len(pool)
+        )
+        if not count:
+            return
+
+        missing = [code for code in pool if not self.find_unit_entries(code)]
+        if missing:
+            self.dialog(
+                messagebox.showerror,
+                "Unit Not Found",
+                f"Not in timetable data: {', '.join(missing)}{self.did_you_mean(missing[0])}"
+            )
+            return
+
+        # Only the basket and the pool are needed, so a snapshot is never read in full
+        entries = [item for code in self.selected_units + pool for item in self.find_unit_entries(code)]
+        planner = ElectivePlanner(entries)
+        try:
+            plans = planner.plan(self.selected_units, pool, count)
+        except ValueError as e:
+            self.dialog(messagebox.showerror, "Planning Error", str(e))
+            return
+
+        if not plans:
+            self.dialog(messagebox.showinfo, "No Combinations", f"No clash-free way to add {count} of these electives.")
+            return
+        self.show_elective_plans(plans, complete=planner.last_search_complete)
+
+    def show_elective_plans(self, plans: List[Dict[str, Any]], complete: bool = True):
+        """List ranked elective combinations; the chosen one is added to the basket."""
+        window = tk.Toplevel(self.master)
+        window.title("Elective Combinations")
+        window.configure(bg="#f0f8ff")
+
+        heading = "Best spread first (fewest exams on the same day, then on consecutive days)"
+        if not complete:
+            heading += "\nSearch stopped early: these are the best combinations found."
+        tk.Label(window, text=heading, bg="#f0f8ff", font=("Arial", 10), justify="left").pack(anchor="w", padx=10, pady=5)
+
+        listbox = tk.Listbox(window, width=90, height=min(len(plans), 15), font=("Courier", 10))
+        for plan in plans:
+            listbox.insert(tk.END, (
+                f"{', '.join(plan['electives'])}  │ same day: {plan['same_day_pairs']}"
+                f"  consecutive days: {plan['consecutive_day_pairs']}"
+            ))
+        listbox.selection_set(0)
+        listbox.pack(fill="both", expand=True, padx=10, pady=5)
+
+        def use_selected():
+            selection = listbox.curselection()
+            if not selection:
+                return
+            for unit_code in plans[selection[0]]["electives"]:
+                if unit_code not in self.selected_units:
+                    self.selected_units.append(unit_code)
+                    self.basket_listbox.insert(tk.END, unit_code)
+            window.destroy()
+            self.update_statistics()
+            self.generate_timetable()
+
+        tk.Button(
+            window, text="Add to Basket", command=use_selected,
+            bg="#27ae60", fg="white", font=("Arial", 11)
+        ).pack(pady=5)
 
     def delete_timetable_row(self, event):
         """Delete selected rows from timetable."""
@@ -455,10 +612,11 @@ class TimetableGUI:
     def export_to_json(self):
         """Export current timetable to JSON."""
         if not self.tree.get_children():
-            messagebox.showerror("No Data", "No timetable data to export.")
+            self.dialog(messagebox.showerror, "No Data", "No timetable data to export.")
             return
         
-        filename = filedialog.asksaveasfilename(
+        filename = self.dialog(
+            filedialog.asksaveasfilename,
             defaultextension=".json",
             filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
         )
@@ -479,19 +637,20 @@ class TimetableGUI:
                 with open(filename, "w", encoding="utf-8") as f:
                     json.dump(data, f, indent=4, ensure_ascii=False)
                 
-                messagebox.showinfo("Export Successful", f"Timetable exported to {filename}")
+                self.dialog(messagebox.showinfo, "Export Successful", f"Timetable exported to {filename}")
                 self.status_bar.config(text=f"Exported to {filename}")
                 
             except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
+                self.dialog(messagebox.showerror, "Export Error", f"Failed to export: {str(e)}")
 
     def export_to_csv(self):
         """Export current timetable to CSV."""
         if not self.tree.get_children():
-            messagebox.showerror("No Data", "No timetable data to export.")
+            self.dialog(messagebox.showerror, "No Data", "No timetable data to export.")
             return
         
-        filename = filedialog.asksaveasfilename(
+        filename = self.dialog(
+            filedialog.asksaveasfilename,
             defaultextension=".csv",
             filetypes=[("CSV files", "*.csv"), ("All files", "*.*")]
         )
@@ -507,11 +666,16 @@ class TimetableGUI:
                         values = self.tree.item(child, "values")
                         writer.writerow(values)
                 
-                messagebox.showinfo("Export Successful", f"Timetable exported to {filename}")
+                self.dialog(messagebox.showinfo, "Export Successful", f"Timetable exported to {filename}")
                 self.status_bar.config(text=f"Exported to {filename}")
                 
             except Exception as e:
-                messagebox.showerror("Export Error", f"Failed to export: {str(e)}")
+                self.dialog(messagebox.showerror, "Export Error", f"Failed to export: {str(e)}")
+
+    def show_latency(self, handler_name):
+        """Append the rolling latency summary for a handler to the status bar."""
+        status = self.status_bar.cget("text").split(" │ ")[0]
+        self.status_bar.config(text=f"{status} │ {self.tracer.format_summary(handler_name)}")
 
     def update_statistics(self):
         """Update statistics display."""
@@ -522,22 +686,48 @@ class TimetableGUI:
 
 def main():
     """Main function to run the GUI."""
-    # Load timetable data
+    import os
+    import sys
+
+    # Load timetable data: JSON by default, a Parquet/Feather export, or a
+    # memory-mapped snapshot that is queried in place
+    data_path = sys.argv[1] if len(sys.argv) > 1 else "output.json"
     try:
-        with open("output.json", "r", encoding="utf-8") as file:
-            timetable_data = json.load(file)
+        if data_path.lower().endswith(".wsnap"):
+            from snapshot import Snapshot
+            timetable_data = Snapshot(data_path)
+        elif data_path.lower().endswith((".parquet", ".feather", ".arrow")):
+            from columnar_store import load_entries
+            timetable_data = load_entries(data_path)
+        else:
+            with open(data_path, "r", encoding="utf-8") as file:
+                timetable_data = json.load(file)
     except FileNotFoundError:
-        messagebox.showerror("File Error", "output.json file not found.")
+        messagebox.showerror("File Error", f"{data_path} file not found.")
         timetable_data = []
     except json.JSONDecodeError:
-        messagebox.showerror("File Error", "Invalid JSON format in output.json.")
+        messagebox.showerror("File Error", f"Invalid JSON format in {data_path}.")
+        timetable_data = []
+    except (ImportError, ValueError) as e:
+        messagebox.showerror("File Error", str(e))
         timetable_data = []
 
     if not timetable_data:
         messagebox.showwarning("No Data", "No timetable data found. The application will run with empty data.")
 
+    # Set WESLEY_TRACE to a file path to record handler latencies, dumped on exit
+    trace_path = os.environ.get("WESLEY_TRACE")
+    tracer = LatencyTracer() if trace_path else None
+
     root = tk.Tk()
-    gui = TimetableGUI(root, timetable_data)
+    gui = TimetableGUI(root, timetable_data, tracer=tracer)
+
+    if tracer is not None:
+        def on_close():
+            tracer.dump(trace_path)
+            root.destroy()
+
+        root.protocol("WM_DELETE_WINDOW", on_close)
     
     # Center the window
     root.update_idletasks()
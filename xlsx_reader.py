@@ -0,0 +1,313 @@
+"""
+Lightweight xlsx sheet reader.
+
+Parses the sheet XML and sharedStrings inside the xlsx zip with incremental
+(iterparse) XML parsing, without building openpyxl cell objects. Timetable
+sheets are mostly shared strings in a fixed grid, which is the case this
+reader is tuned for. Values are converted the way pandas' openpyxl engine
+converts them, so ExcelMapper gets the same frame from either engine.
+The sheet still becomes a DataFrame, since the mapper works on frames;
+read_sheet explains the cost.
+"""
+import datetime
+import posixpath
+import re
+import zipfile
+from array import array
+from typing import Iterator, List, Dict, Tuple, Any, Union
+from xml.etree.ElementTree import iterparse
+
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+MAIN_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+REL_NS = "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+PKG_REL_NS = "{http://schemas.openxmlformats.org/package/2006/relationships}"
+
+# Built-in number formats that display dates or times
+BUILTIN_DATE_FORMATS = set(range(14, 23)) | {45, 46, 47}
+# Strip quoted text, escapes and colours before looking for date tokens
+FORMAT_NOISE = re.compile(r'"[^"]*"|\\.|\[[^\]]*\]')
+EXCEL_EPOCH = datetime.datetime(1899, 12, 30)
+
+
+def _column_index(ref: str) -> int:
+    """0-based column index of a cell reference such as "AB12"."""
+    index = 0
+    for ch in ref:
+        if ch.isdigit():
+            break
+        index = index * 26 + (ord(ch) - 64)
+    return index - 1
+
+
+def _sheet_path(archive: zipfile.ZipFile, sheet_name: Union[int, str]) -> str:
+    """Resolve a sheet index or name to its XML part inside the archive."""
+    relationships = {}
+    for _, elem in iterparse(archive.open("xl/_rels/workbook.xml.rels")):
+        if elem.tag == f"{PKG_REL_NS}Relationship":
+            relationships[elem.get("Id")] = elem.get("Target")
+
+    sheets = []
+    for _, elem in iterparse(archive.open("xl/workbook.xml")):
+        if elem.tag == f"{MAIN_NS}sheet":
+            sheets.append((elem.get("name"), relationships[elem.get(f"{REL_NS}id")]))
+
+    if isinstance(sheet_name, int):
+        if not 0 <= sheet_name < len(sheets):
+            raise ValueError(f"Worksheet index {sheet_name} is invalid, {len(sheets)} worksheets found")
+        target = sheets[sheet_name][1]
+    else:
+        matches = [target for name, target in sheets if name == sheet_name]
+        if not matches:
+            raise ValueError(f"Worksheet named '{sheet_name}' not found")
+        target = matches[0]
+
+    if target.startswith("/"):
+        return target.lstrip("/")
+    return posixpath.normpath(posixpath.join("xl", target))
+
+
+def _shared_strings(archive: zipfile.ZipFile) -> List[str]:
+    """Read the shared string table, joining rich-text runs."""
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+
+    strings = []
+    for _, elem in iterparse(archive.open("xl/sharedStrings.xml")):
+        if elem.tag == f"{MAIN_NS}si":
+            # Plain text is a direct <t>; rich text is <r><t> runs. Phonetic
+            # runs (<rPh>) are annotations, not part of the value.
+            parts = []
+            for child in elem:
+                if child.tag == f"{MAIN_NS}t":
+                    parts.append(child.text or "")
+                elif child.tag == f"{MAIN_NS}r":
+                    parts.extend(t.text or "" for t in child.iter(f"{MAIN_NS}t"))
+            strings.append("".join(parts))
+            elem.clear()
+    return strings
+
+
+def _date_styles(archive: zipfile.ZipFile) -> List[bool]:
+    """For each cell style index, whether it formats numbers as dates or times."""
+    if "xl/styles.xml" not in archive.namelist():
+        return []
+
+    custom_formats: Dict[int, str] = {}
+    date_styles = []
+    in_cell_xfs = False
+    for event, elem in iterparse(archive.open("xl/styles.xml"), events=("start", "end")):
+        if elem.tag == f"{MAIN_NS}numFmt" and event == "end":
+            custom_formats[int(elem.get("numFmtId"))] = elem.get("formatCode", "")
+        elif elem.tag == f"{MAIN_NS}cellXfs":
+            in_cell_xfs = event == "start"
+        elif elem.tag == f"{MAIN_NS}xf" and in_cell_xfs and event == "end":
+            fmt_id = int(elem.get("numFmtId", 0))
+            if fmt_id in custom_formats:
+                code = FORMAT_NOISE.sub("", custom_formats[fmt_id]).lower()
+                date_styles.append(any(token in code for token in ("d", "m", "y", "h", "s")))
+            else:
+                date_styles.append(fmt_id in BUILTIN_DATE_FORMATS)
+    return date_styles
+
+
+def _from_excel_date(serial: float) -> Any:
+    """Convert an Excel serial date like openpyxl does: a time for pure times, else a Timestamp."""
+    day, fraction = divmod(serial, 1)
+    moment = EXCEL_EPOCH + datetime.timedelta(
+        days=day, milliseconds=round(fraction * 86400 * 1000)
+    )
+    if 0 <= serial < 1:
+        return moment.time()
+    return pd.Timestamp(moment)
+
+
+def _iter_rows(filepath: str, sheet_name: Union[int, str] = 0) -> Iterator[Tuple[int, List[Tuple[int, Any]]]]:
+    """
+    Stream a worksheet row by row.
+
+    Yields (0-based row number, [(0-based column, value), ...]) for each row
+    element in the sheet XML, with empty cells left out. Values are converted
+    as described in read_sheet_rows.
+    """
+    cell_tag, row_tag = f"{MAIN_NS}c", f"{MAIN_NS}row"
+    value_tag, text_tag = f"{MAIN_NS}v", f"{MAIN_NS}t"
+
+    with zipfile.ZipFile(filepath) as archive:
+        strings = _shared_strings(archive)
+        date_styles = _date_styles(archive)
+        sheet = archive.open(_sheet_path(archive, sheet_name))
+
+        cells: List[Tuple[int, Any]] = []
+        next_col = next_row = 0
+
+        # Only end events are needed: a <c> element is complete, with its
+        # attributes and <v> child, by the time it closes
+        for _, elem in iterparse(sheet):
+            tag = elem.tag
+            if tag == cell_tag:
+                cell_type = elem.get("t", "n")
+                if cell_type == "inlineStr":
+                    converted = "".join(t.text or "" for t in elem.iter(text_tag))
+                else:
+                    value_elem = elem.find(value_tag)
+                    value = value_elem.text if value_elem is not None else None
+                    if cell_type == "e":
+                        converted = np.nan
+                    elif value is None:
+                        converted = ""
+                    elif cell_type == "s":
+                        converted = strings[int(value)]
+                    elif cell_type == "str":
+                        converted = value
+                    elif cell_type == "b":
+                        converted = value == "1"
+                    else:
+                        number = float(value)
+                        style = int(elem.get("s", 0))
+                        if style < len(date_styles) and date_styles[style]:
+                            converted = _from_excel_date(number)
+                        else:
+                            converted = int(number) if number == int(number) else number
+
+                ref = elem.get("r")
+                col = _column_index(ref) if ref else next_col
+                next_col = col + 1
+                if not (isinstance(converted, str) and converted == ""):
+                    cells.append((col, converted))
+                elem.clear()
+            elif tag == row_tag:
+                r = elem.get("r")
+                # Rows absent from the XML are empty rows
+                number = int(r) - 1 if r else next_row
+                yield number, cells
+                cells = []
+                next_col = 0
+                next_row = number + 1
+                elem.clear()
+
+
+def read_sheet_rows(filepath: str, sheet_name: Union[int, str] = 0) -> List[List[Any]]:
+    """
+    Read a worksheet into rows of raw values.
+
+    Empty cells are "", numbers are int when integral, date-formatted numbers
+    become Timestamps and error cells become NaN, matching pandas' openpyxl
+    engine. Trailing empty cells and rows are trimmed and rows are padded to
+    the same width.
+    """
+    data: List[List[Any]] = []
+    for number, cells in _iter_rows(filepath, sheet_name):
+        data.extend([] for _ in range(number - len(data)))
+        row: List[Any] = []
+        for col, value in cells:
+            if len(row) < col:
+                row.extend([""] * (col - len(row)))
+            row.append(value)
+        data.append(row)
+
+    # Trim trailing empty cells and rows, then pad to the widest row
+    for r in data:
+        while r and isinstance(r[-1], str) and r[-1] == "":
+            r.pop()
+    while data and not data[-1]:
+        data.pop()
+    if data:
+        width = max(len(r) for r in data)
+        data = [r + [""] * (width - len(r)) for r in data]
+    return data
+
+
+def read_sheet(filepath: str, sheet_name: Union[int, str] = 0) -> pd.DataFrame:
+    """
+    Read a worksheet into the frame pd.read_excel(header=0) would build.
+
+    Rows go through the same TextParser pandas uses for Excel data, so
+    column names, NaNs and dtypes match the openpyxl engine. The frame is
+    kept, rather than handing the rows to the mapper, because the mapper
+    cuts and reads sections positionally from a frame and relies on those
+    dtypes to format values as the openpyxl path does. Building it costs
+    memory: on a 10 MB workbook the peak is 533 MB against 391 MB for the
+    rows alone. read_sheet_categorical is the reader that avoids both.
+    """
+    rows = read_sheet_rows(filepath, sheet_name)
+    if not rows:
+        return pd.DataFrame()
+    return TextParser(rows, header=0).read()
+
+
+def _categorical_column(distinct: Dict[Any, int], codes: np.ndarray) -> pd.Categorical:
+    """
+    Build a column from its distinct raw values and one code per row (-1 if empty).
+
+    The distinct values go through TextParser, with a missing value added
+    when the column has empty cells, so NaNs and numeric dtypes come out as
+    read_sheet would give them for the whole column.
+    """
+    raw = [key if isinstance(key, str) else key[1] for key in distinct]
+    rows = [[value, 0] for value in raw]
+    if (codes < 0).any():
+        rows.append([np.nan, 0])
+    parsed = TextParser(rows, header=None).read()[0].iloc[:len(raw)].astype("category")
+    recode = parsed.cat.codes.to_numpy()
+    if len(recode):
+        codes = np.where(codes >= 0, recode[np.maximum(codes, 0)], -1)
+    return pd.Categorical.from_codes(codes, dtype=parsed.dtype)
+
+
+def read_sheet_categorical(filepath: str, sheet_name: Union[int, str] = 0) -> pd.DataFrame:
+    """
+    Read a worksheet straight into a frame of categorical columns.
+
+    Gives the frame read_sheet would build, with trailing empty rows and
+    columns trimmed and every column made categorical, without building that
+    frame first. While the sheet is parsed each column keeps an int32 code
+    per row and each distinct value once, so shared strings stay shared.
+    """
+    header: List[Tuple[int, Any]] = []
+    columns: List[array] = []
+    distinct: List[Dict[Any, int]] = []
+    n_rows = 0
+    for number, cells in _iter_rows(filepath, sheet_name):
+        if number == 0:
+            header = cells
+            continue
+        row = number - 1
+        for col, value in cells:
+            while len(columns) <= col:
+                columns.append(array("i"))
+                distinct.append({})
+            codes, values = columns[col], distinct[col]
+            if len(codes) < row:
+                codes.extend([-1] * (row - len(codes)))
+            # 1, 1.0 and True are equal dict keys, so non-strings carry their type
+            key = value if isinstance(value, str) else (type(value), value)
+            codes.append(values.setdefault(key, len(values)))
+        if cells:
+            n_rows = row + 1
+
+    frame_columns = []
+    for codes, values in zip(columns, distinct):
+        padded = np.full(n_rows, -1, dtype=np.int32)
+        padded[:len(codes)] = np.frombuffer(codes, dtype=np.int32) if len(codes) else []
+        frame_columns.append(_categorical_column(values, padded))
+    del columns
+
+    # Values TextParser read as missing can leave more trailing rows and
+    # columns empty; trim the way the default path trims its frame
+    last_rows = [np.flatnonzero(column.codes >= 0) for column in frame_columns]
+    used = [i for i, rows in enumerate(last_rows) if len(rows)]
+    if not used:
+        return pd.DataFrame()
+    width = used[-1] + 1
+    height = max(rows[-1] for rows in last_rows if len(rows)) + 1
+
+    names_row = [""] * max(width, header[-1][0] + 1 if header else 0)
+    for col, value in header:
+        names_row[col] = value
+    names = TextParser([names_row], header=0).read().columns[:width]
+    return pd.DataFrame(
+        {i: frame_columns[i][:height] for i in range(width)}
+    ).set_axis(names, axis=1)